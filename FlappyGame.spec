@@ -5,7 +5,7 @@ a = Analysis(
     ['flappy\\Flappy.py'],
     pathex=[],
     binaries=[],
-    datas=[('flappy/images/*', 'images'), ('flappy/res/*', 'res'), ('flappy/mediapipe/modules', 'mediapipe/modules')],
+    datas=[('flappy/images/*', 'images'), ('flappy/audio/*', 'audio'), ('flappy/res/*', 'res'), ('flappy/mediapipe/modules', 'mediapipe/modules')],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,107 @@
+"""End-to-end frame-time benchmark of the game loop.
+
+Usage (from the repository root; assets resolve against the flappy package):
+    python -m benchmarks.game_loop --video clip.mp4 [--frames 2000] [--output results.json]
+    python -m benchmarks.game_loop --synthetic   # no video or inference, e.g. on CI
+
+GameEngine runs headless and steps as fast as the CPU allows; games are replayed,
+and the last one cut short, until exactly the requested number of frames has
+been rendered. Per-stage timings come
+from the engine's Profiler and are written as JSON for comparison across commits.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import time
+
+import cv2 as cv
+
+from flappy.FaceTracker import FaceTracker
+from flappy.GameEngine import GameEngine
+from flappy.InputSource import VideoFileSource, SyntheticFaceSource
+from flappy.Profiler import Profiler, percentile
+from flappy.constants import HEADLESS_WINDOW_SIZE
+
+STAGES = ("capture", "color", "inference", "camera_age", "tracking", "physics", "collision", "render", "flip", "frame")
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_benchmark(args) -> dict:
+    profiler = Profiler()
+    if args.synthetic:
+        window_size = HEADLESS_WINDOW_SIZE
+        face_tracker = SyntheticFaceSource(frame_size=window_size)
+    else:
+        source = VideoFileSource(args.video, loop=True)
+        window_size = (int(source.get(cv.CAP_PROP_FRAME_WIDTH)), int(source.get(cv.CAP_PROP_FRAME_HEIGHT)))
+        face_tracker = FaceTracker(input_source=source, profiler=profiler)
+    game = GameEngine(headless=True, face_tracker=face_tracker, window_size=window_size,
+                      seed=args.seed, render_mode=args.render_mode, profiler=profiler)
+    games = 0
+    try:
+        start = time.perf_counter()
+        while len(profiler.samples["frame"]) < args.frames:
+            # The last game is cut short so exactly args.frames frames are rendered
+            game.frame_limit = args.frames - len(profiler.samples["frame"])
+            game.game_loop()
+            games += 1
+        elapsed = time.perf_counter() - start
+    finally:
+        game.cleanup()
+
+    frame_times = sorted(profiler.samples["frame"])
+    stages = profiler.summary()
+    return {
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "source": "synthetic" if args.synthetic else args.video,
+        "render_mode": args.render_mode,
+        "window_size": list(window_size),
+        "games": games,
+        "frames": len(frame_times),
+        "fps": len(frame_times) / elapsed,
+        "frame_ms": {
+            "p50": percentile(frame_times, 0.50) * 1000,
+            "p95": percentile(frame_times, 0.95) * 1000,
+            "p99": percentile(frame_times, 0.99) * 1000,
+        },
+        "stages": {name: stages[name] for name in STAGES if name in stages},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--video", help="Recorded video to track faces in")
+    source.add_argument("--synthetic", action="store_true", help="Use a synthetic trajectory instead of a video")
+    parser.add_argument("--frames", type=int, default=2000, help="Frames to render in total")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the pipe layout")
+    parser.add_argument("--render-mode", choices=("full", "dirty"), default="full")
+    parser.add_argument("--output", default="game_loop_benchmark.json", help="Where to write the JSON results")
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+
+    print(f"{results['frames']} frames over {results['games']} games: {results['fps']:.1f} FPS, "
+          f"p50 {results['frame_ms']['p50']:.2f} ms, p95 {results['frame_ms']['p95']:.2f} ms, "
+          f"p99 {results['frame_ms']['p99']:.2f} ms")
+    print(f"{'stage':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stage in results["stages"].items():
+        print(f"{name:<12}{stage['mean_ms']:>10.3f}{stage['p50_ms']:>10.3f}"
+              f"{stage['p95_ms']:>10.3f}{stage['p99_ms']:>10.3f}")
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
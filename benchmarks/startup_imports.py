@@ -0,0 +1,61 @@
+"""Cold-start import cost of the menu, measured with python -X importtime.
+
+Usage (from the repository root):
+    python -m benchmarks.startup_imports [--top 15] [--budget 1.0]
+
+Imports flappy.Flappy in a fresh interpreter, lists the most expensive imports
+and checks that the game engine's heavy dependencies are not loaded up front.
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+# Modules that should only load on first use (leaderboard I/O, game start)
+DEFERRED_MODULES = ("flappy.GameEngine", "cv2", "pygame", "mediapipe", "pandas", "openpyxl")
+
+
+def measure(module: str) -> tuple:
+    """Import module in a new interpreter; returns (wall seconds, {name: cumulative us})."""
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        raise SystemExit(completed.stderr.strip().splitlines()[-1])
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        cumulative[name] = int(cumulative_us)
+    return elapsed, cumulative
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="flappy.Flappy", help="Module whose import is measured")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    parser.add_argument("--budget", type=float, default=1.0, help="Target import time in seconds")
+    args = parser.parse_args()
+
+    elapsed, cumulative = measure(args.module)
+    total = cumulative.get(args.module, 0) / 1e6
+    print(f"import {args.module}: {total:.3f} s ({elapsed:.3f} s including interpreter start)")
+    print(f"{'cumulative ms':>14}  module")
+    top_level = {name: us for name, us in cumulative.items() if "." not in name or name.startswith("flappy.")}
+    for name, us in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"{us / 1000:>14.1f}  {name}")
+
+    loaded = [name for name in DEFERRED_MODULES if name in cumulative]
+    if loaded:
+        print(f"Loaded at startup but should be deferred: {', '.join(loaded)}")
+    verdict = "within" if total <= args.budget else "over"
+    print(f"{verdict} the {args.budget:.2f} s budget")
+    if loaded or total > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
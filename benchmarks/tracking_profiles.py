@@ -0,0 +1,91 @@
+"""Per-frame FaceMesh latency for each tracking profile.
+
+Usage (from the repository root; assets resolve against the flappy package):
+    python -m benchmarks.tracking_profiles [--video clip.mp4] [--frames 300]
+
+Frames are captured and preprocessed up front so only FaceMesh.process is timed.
+"""
+import argparse
+import statistics
+import time
+
+import cv2 as cv
+
+import flappy.face_mesh as face_mesh
+from flappy.util import resource_path
+from flappy.constants import FRONT_CPU_BINARYPB, INFERENCE_WIDTH, NOSE_LANDMARK_INDEX
+
+
+def capture_frames(source, count: int, width: int) -> list:
+    """Read, mirror, convert and downscale frames the same way FaceTracker does."""
+    video_capture = cv.VideoCapture(source)
+    frames = []
+    try:
+        while len(frames) < count:
+            ret, frame = video_capture.read()
+            if not ret:
+                break
+            frame = cv.cvtColor(cv.flip(frame, 1), cv.COLOR_BGR2RGB)
+            height, frame_width = frame.shape[:2]
+            if width and frame_width > width:
+                frame = cv.resize(frame, (width, max(1, round(height * width / frame_width))),
+                                  interpolation=cv.INTER_AREA)
+            frames.append(frame)
+    finally:
+        video_capture.release()
+    return frames
+
+
+def benchmark_profile(profile: str, frames: list, warmup: int) -> dict:
+    mesh = face_mesh.FaceMesh.from_profile(
+        profile,
+        max_num_faces=1,
+        binary_graph_path=resource_path(FRONT_CPU_BINARYPB)
+    )
+    latencies = []
+    detections = 0
+    try:
+        for index, frame in enumerate(frames):
+            start = time.perf_counter()
+            results = mesh.process(frame)
+            elapsed = time.perf_counter() - start
+            if index < warmup:
+                continue
+            latencies.append(elapsed * 1000)
+            if results.multi_face_landmarks and \
+                    len(results.multi_face_landmarks[0].landmark) > NOSE_LANDMARK_INDEX:
+                detections += 1
+    finally:
+        mesh.close()
+    latencies.sort()
+    return {
+        "profile": profile,
+        "frames": len(latencies),
+        "mean_ms": statistics.fmean(latencies),
+        "p50_ms": latencies[len(latencies) // 2],
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "detection_rate": detections / len(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--video", help="Video file to read instead of camera 0")
+    parser.add_argument("--frames", type=int, default=300, help="Frames to process per profile")
+    parser.add_argument("--warmup", type=int, default=30, help="Leading frames excluded from timings")
+    parser.add_argument("--width", type=int, default=INFERENCE_WIDTH, help="Inference width (0 for full size)")
+    args = parser.parse_args()
+
+    frames = capture_frames(args.video if args.video else 0, args.frames + args.warmup, args.width)
+    if len(frames) <= args.warmup:
+        raise SystemExit("Not enough frames captured for a benchmark.")
+    print(f"{len(frames)} frames of {frames[0].shape[1]}x{frames[0].shape[0]}")
+    print(f"{'profile':<10}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'faces':>8}")
+    for profile in face_mesh.TRACKING_PROFILES:
+        result = benchmark_profile(profile, frames, args.warmup)
+        print(f"{result['profile']:<10}{result['mean_ms']:>10.2f}{result['p50_ms']:>10.2f}"
+              f"{result['p95_ms']:>10.2f}{result['detection_rate']:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+import glob
+import hashlib
+import os
+import struct
+from typing import Callable, Optional
+
+import pygame
+from pygame import SurfaceType
+
+from flappy.constants import ASSET_CACHE_DIR, SPRITE_BIRD, SPRITE_PIPES, GAME_OVER_LOGO_PATH
+
+# Bird frames are drawn at this size; their collision rect uses a flattened copy
+BIRD_FRAME_SIZE = (100, 73)
+# Window height the pipe sprite is drawn 1:1 at
+PIPE_REFERENCE_HEIGHT = 1328
+
+_MAGIC = b"FLAC"
+_COUNT = struct.Struct("<I")
+_FRAME_SIZE = struct.Struct("<II")
+
+
+class AssetCache:
+    """On-disk cache of decoded, already scaled sprites stored as raw RGBA.
+
+    Each entry holds one or more frames and is keyed by the asset name, the size
+    it was scaled for and a hash of the source file, so editing an image or
+    playing at another resolution bakes a new entry. Hits are wrapped with
+    pygame.image.frombuffer, skipping the PNG/GIF decode and the rescale.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = ASSET_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self._source_hashes: dict = {}
+
+    def source_hash(self, source_path: str) -> str:
+        digest = self._source_hashes.get(source_path)
+        if digest is None:
+            with open(source_path, "rb") as source:
+                digest = hashlib.sha1(source.read()).hexdigest()[:16]
+            self._source_hashes[source_path] = digest
+        return digest
+
+    def entry_path(self, name: str, size: tuple, source_path: str) -> str:
+        return os.path.join(self.cache_dir, f"{name}-{size[0]}x{size[1]}-{self.source_hash(source_path)}.rgba")
+
+    def load(self, name: str, size: tuple, source_path: str, decode: Callable[[], list]) -> list:
+        """Return the frames cached for (name, size, source), decoding and storing them on a miss.
+
+        decode returns the list of frames for a miss; it is not called on a hit.
+        """
+        if self.cache_dir is None:
+            return decode()
+        # Camera resolutions arrive as floats; 1280.0 and 1280 must share an entry
+        size = (int(size[0]), int(size[1]))
+        path = self.entry_path(name, size, source_path)
+        frames = self._read(path)
+        if frames is None:
+            frames = decode()
+            self._write(path, frames)
+        return frames
+
+    @staticmethod
+    def _read(path: str) -> Optional[list]:
+        """Private method to wrap a cache entry's frames; None on a miss or damaged entry."""
+        try:
+            with open(path, "rb") as entry:
+                data = bytearray(entry.read())
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"Error reading asset cache entry {path}: {e}")
+            return None
+        try:
+            if data[:len(_MAGIC)] != _MAGIC:
+                raise ValueError("bad header")
+            view = memoryview(data)
+            offset = len(_MAGIC)
+            (count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            frames = []
+            for _ in range(count):
+                width, height = _FRAME_SIZE.unpack_from(data, offset)
+                offset += _FRAME_SIZE.size
+                end = offset + width * height * 4
+                if end > len(data):
+                    raise ValueError("truncated frame")
+                # The surface shares the entry's buffer instead of copying the pixels
+                frames.append(pygame.image.frombuffer(view[offset:end], (width, height), "RGBA"))
+                offset = end
+            return frames
+        except (struct.error, ValueError) as e:
+            print(f"Ignoring damaged asset cache entry {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write(path: str, frames: list):
+        """Private method to store frames, replacing older bakes of the same asset and size."""
+        temp_path = path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, "wb") as entry:
+                entry.write(_MAGIC)
+                entry.write(_COUNT.pack(len(frames)))
+                for frame in frames:
+                    entry.write(_FRAME_SIZE.pack(*frame.get_size()))
+                    entry.write(pygame.image.tobytes(frame, "RGBA"))
+            os.replace(temp_path, path)
+            stem = path.rsplit("-", 1)[0]
+            for stale_path in glob.glob(glob.escape(stem) + "-*.rgba"):
+                if stale_path != path:
+                    os.remove(stale_path)
+        except OSError as e:
+            print(f"Error writing asset cache entry {path}: {e}")
+
+
+_default_cache: Optional[AssetCache] = None
+
+
+def default_cache() -> AssetCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = AssetCache()
+    return _default_cache
+
+
+def load_bird_atlas(cache: Optional[AssetCache] = None) -> SurfaceType:
+    """The pterodactyl animation as one RGBA strip of BIRD_FRAME_SIZE frames, left to right."""
+    def decode() -> list:
+        from PIL import Image, ImageSequence
+
+        pil_image = Image.open(SPRITE_BIRD)
+        if pil_image.format == 'GIF' and pil_image.is_animated:
+            pil_frames = [frame.convert('RGBA') for frame in ImageSequence.Iterator(pil_image)]
+        else:
+            pil_frames = [pil_image.convert('RGBA')]
+        frame_width, frame_height = BIRD_FRAME_SIZE
+        atlas = pygame.Surface((frame_width * len(pil_frames), frame_height), pygame.SRCALPHA)
+        for index, frame in enumerate(pil_frames):
+            surface = pygame.image.frombytes(frame.tobytes(), frame.size, 'RGBA')
+            atlas.blit(pygame.transform.scale(surface, BIRD_FRAME_SIZE), (index * frame_width, 0))
+        return [atlas]
+
+    return (cache or default_cache()).load("bird_atlas", BIRD_FRAME_SIZE, SPRITE_BIRD, decode)[0]
+
+
+def load_pipe_image(window_size: tuple, cache: Optional[AssetCache] = None) -> SurfaceType:
+    """The bottom pipe sprite scaled to the window height."""
+    def decode() -> list:
+        return [pygame.transform.scale_by(pygame.image.load(SPRITE_PIPES), window_size[1] / PIPE_REFERENCE_HEIGHT)]
+
+    return (cache or default_cache()).load("pipe", window_size, SPRITE_PIPES, decode)[0]
+
+
+def load_game_over_logo(window_size: tuple, cache: Optional[AssetCache] = None) -> SurfaceType:
+    """The game over art scaled to a quarter of the window in each dimension."""
+    size = (int(window_size[0] * 0.25), int(window_size[1] * 0.25))
+
+    def decode() -> list:
+        return [pygame.transform.scale(pygame.image.load(GAME_OVER_LOGO_PATH), size)]
+
+    return (cache or default_cache()).load("game_over", size, GAME_OVER_LOGO_PATH, decode)[0]
+
+
+def prebake(window_size: tuple, cache: Optional[AssetCache] = None):
+    """Make sure every resolution-specific sprite for window_size is in the cache.
+
+    Needs no display, so it can run on a background thread or at install time.
+    """
+    window_size = (int(window_size[0]), int(window_size[1]))
+    load_bird_atlas(cache)
+    load_pipe_image(window_size, cache)
+    load_game_over_logo(window_size, cache)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # Usage: python -m flappy.AssetCache 1920x1080 [1280x720 ...]
+    for argument in sys.argv[1:]:
+        width, height = (int(value) for value in argument.lower().split("x"))
+        prebake((width, height))
+        print(f"Baked assets for {width}x{height}")
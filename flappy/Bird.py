@@ -1,57 +1,55 @@
-from PIL import Image, ImageSequence
-from collections import namedtuple
 import pygame
+from pygame import SurfaceType
 from pygame.rect import RectType
 
-from flappy.constants import SPRITE_BIRD
+from flappy.AssetCache import load_bird_atlas, BIRD_FRAME_SIZE
+from flappy.constants import BIRD_FRAME_DURATION
+
 
-IMAGE = namedtuple('image', ['frame', 'rect'])
 class Bird:
     window_size = None
 
 
     def __init__(self, window_size: tuple):
         Bird.window_size = window_size
+        # Every animation frame lives in one surface; a frame is just its area of the atlas
+        self.atlas: SurfaceType = load_bird_atlas().convert_alpha()
+        frame_width, frame_height = BIRD_FRAME_SIZE
+        self.frame_count = self.atlas.get_width() // frame_width
+        self.frame_areas: list = [pygame.Rect(index * frame_width, 0, frame_width, frame_height)
+                                  for index in range(self.frame_count)]
+        self.frames: list = [self.atlas.subsurface(area) for area in self.frame_areas]
+        self.masks: list = [pygame.mask.from_surface(frame) for frame in self.frames]
+        # One position shared by all frames; the collision box is a flattened copy of a frame
+        self._rect: RectType = pygame.Rect(0, 0, frame_width, 20)
+        self._rect.center = (Bird.window_size[0] // 6, Bird.window_size[1] // 2)
         self.current_frame = 0
-        self.images: list = Bird.__load_gif(SPRITE_BIRD)
-        self.frame_count = len(self.images)
-
-
-    @staticmethod
-    def __pil_image_to_surface(pil_image):
-        mode, size, data = pil_image.mode, pil_image.size, pil_image.tobytes()
-        return pygame.image.fromstring(data, size, mode).convert_alpha()
-
-    @staticmethod
-    def __load_gif(filename) -> list:
-        def make_frame(image) -> IMAGE:
-            pygame_image = pygame.transform.scale(Bird.__pil_image_to_surface(image), (100, 73))
-            rect = pygame.transform.scale(Bird.__pil_image_to_surface(image), (100, 20)).get_rect()
-            rect.center = (Bird.window_size[0] // 6, Bird.window_size[1] // 2)
-            return IMAGE(pygame_image, rect)
-
-        pil_image: Image = Image.open(filename)
-        frames: list = []
-        if pil_image.format == 'GIF' and pil_image.is_animated:
-            for frame in ImageSequence.Iterator(pil_image):
-                frames.append(make_frame(frame.convert('RGBA')))
-        else:
-            frames.append(make_frame(pil_image))
-        return frames
+        self.frame_time = 0.0
 
     def move(self, pos):
-        rect = self.images[self.current_frame].rect
+        rect = self._rect
         rect.centery = (pos - 0.5) * 1.5 * Bird.window_size[1] + Bird.window_size[1] / 2
         rect.y = max(0, min(rect.y, Bird.window_size[1] - rect.height))
 
-    def draw(self, screen):
-        screen.blit(*self.images[self.current_frame])
-        self.current_frame = (self.current_frame + 1) % self.frame_count
+    def animate(self, delta_time: float):
+        """Advance the animation by delta_time seconds, independent of the frame rate."""
+        self.frame_time += delta_time
+        if self.frame_time >= BIRD_FRAME_DURATION:
+            elapsed_frames = int(self.frame_time // BIRD_FRAME_DURATION)
+            self.frame_time -= elapsed_frames * BIRD_FRAME_DURATION
+            self.current_frame = (self.current_frame + elapsed_frames) % self.frame_count
+
+    def draw(self, screen) -> RectType:
+        return screen.blit(self.atlas, self._rect, self.frame_areas[self.current_frame])
 
     @property
     def rect(self)->RectType:
-        return self.images[self.current_frame].rect
+        return self._rect
 
     @property
     def frame(self):
-        return self.images[self.current_frame].frame
\ No newline at end of file
+        return self.frames[self.current_frame]
+
+    @property
+    def mask(self):
+        return self.masks[self.current_frame]
@@ -0,0 +1,128 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+import flappy.face_mesh as face_mesh
+
+
+def _inference_worker(connection, binary_graph_path: str, landmark_index: int,
+                      tracking_profile: str, min_detection_confidence: float,
+                      min_tracking_confidence: float) -> None:
+    """Worker process entry point: run FaceMesh on frames found in shared memory."""
+    mesh = face_mesh.FaceMesh.from_profile(
+        tracking_profile,
+        max_num_faces=1,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
+        binary_graph_path=binary_graph_path
+    )
+    frame_buffer: Optional[shared_memory.SharedMemory] = None
+    try:
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            buffer_name, shape = message
+            if frame_buffer is None or frame_buffer.name != buffer_name:
+                # The parent reallocated the buffer (e.g. camera resolution changed)
+                if frame_buffer is not None:
+                    frame_buffer.close()
+                frame_buffer = shared_memory.SharedMemory(name=buffer_name)
+            image = np.ndarray(shape, dtype=np.uint8, buffer=frame_buffer.buf)
+            results = mesh.process(image)
+            del image  # Release the view so the buffer can be closed
+            if results.multi_face_landmarks:
+                connection.send(results.multi_face_landmarks[0].landmark[landmark_index].y)
+            else:
+                connection.send(None)
+    except EOFError:
+        pass  # Parent went away
+    finally:
+        if frame_buffer is not None:
+            frame_buffer.close()
+        mesh.close()
+
+
+class InferenceWorkerError(RuntimeError):
+    """The inference worker process died and could not be restarted."""
+
+
+class FaceMeshProcess:
+    """Runs FaceMesh in a separate process so inference does not share the game's GIL.
+
+    Frames are copied into a shared memory block rather than pickled; only the
+    block name, the frame shape and the resulting landmark y value cross the pipe.
+    A worker that dies is restarted up to MAX_RESTARTS times.
+    """
+    MAX_RESTARTS = 3
+
+    def __init__(self, binary_graph_path: str, landmark_index: int, tracking_profile: str = "fast",
+                 min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5):
+        self._worker_args = (binary_graph_path, landmark_index, tracking_profile,
+                             min_detection_confidence, min_tracking_confidence)
+        self._frame_buffer: Optional[shared_memory.SharedMemory] = None
+        self.restarts = 0
+        self._start_worker()
+
+    def _start_worker(self) -> None:
+        self._connection, worker_connection = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_inference_worker,
+            args=(worker_connection,) + self._worker_args,
+            daemon=True
+        )
+        self._process.start()
+        worker_connection.close()
+
+    def _restart_worker(self) -> None:
+        """Private method to replace a dead worker, or raise once restarts are used up."""
+        self._connection.close()
+        self._process.join(timeout=1)
+        if self.restarts >= FaceMeshProcess.MAX_RESTARTS:
+            raise InferenceWorkerError(
+                f"Face inference worker exited with code {self._process.exitcode} "
+                f"after {self.restarts} restarts")
+        self.restarts += 1
+        print(f"Face inference worker exited with code {self._process.exitcode}; restarting")
+        self._start_worker()
+
+    def _release_buffer(self) -> None:
+        if self._frame_buffer is not None:
+            self._frame_buffer.close()
+            self._frame_buffer.unlink()
+            self._frame_buffer = None
+
+    def landmark_y(self, image: np.ndarray) -> Optional[float]:
+        """Return the normalized y of the tracked landmark in an RGB image, or None.
+
+        None is also returned for the frame in flight when the worker dies and is
+        restarted; InferenceWorkerError is raised when it cannot be restarted.
+        """
+        if self._frame_buffer is None or self._frame_buffer.size < image.nbytes:
+            self._release_buffer()
+            self._frame_buffer = shared_memory.SharedMemory(create=True, size=image.nbytes)
+        shared_image = np.ndarray(image.shape, dtype=np.uint8, buffer=self._frame_buffer.buf)
+        np.copyto(shared_image, image)
+        del shared_image
+        try:
+            self._connection.send((self._frame_buffer.name, image.shape))
+            return self._connection.recv()
+        except (EOFError, OSError):
+            # BrokenPipeError and ConnectionResetError are OSErrors
+            self._restart_worker()
+            return None
+
+    def close(self) -> None:
+        """Stop the worker process and free the shared frame buffer."""
+        if self._process.is_alive():
+            try:
+                self._connection.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._connection.close()
+        self._release_buffer()
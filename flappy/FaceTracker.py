@@ -1,37 +1,219 @@
+import time
+import threading
+from collections import namedtuple
+from typing import Optional
+
+import numpy as np
 import flappy.face_mesh as face_mesh
 import cv2 as cv
+from flappy.FaceMeshProcess import FaceMeshProcess, InferenceWorkerError
+from flappy.InputSource import InputSource, CameraSource
+from flappy.Profiler import Profiler
 from flappy.util import resource_path
-from flappy.constants import FRONT_CPU_BINARYPB
+from flappy.constants import (
+    FRONT_CPU_BINARYPB,
+    NOSE_LANDMARK_INDEX,
+    FACE_INFERENCE_BACKEND,
+    INFERENCE_WIDTH,
+    TRACKING_PROFILE,
+    MIN_DETECTION_CONFIDENCE,
+    MIN_TRACKING_CONFIDENCE)
+
+# timestamp is the time.monotonic() at which capture of the frame started
+FaceSample = namedtuple('FaceSample', ['position', 'frame', 'timestamp'])
+
+
+class FrameRing:
+    """A fixed set of preallocated RGB frame buffers handed out round-robin.
+
+    A buffer is only rewritten after ``size - 1`` newer frames, which gives a
+    reader on another thread that long to finish with the frame it holds.
+    """
+
+    def __init__(self, size: int = 3):
+        self.size = size
+        self.buffers: list = []
+        self._index = 0
+
+    def next(self, shape: tuple) -> np.ndarray:
+        """Return the next buffer to write into, reallocating if the shape changed."""
+        if not self.buffers or self.buffers[0].shape != shape:
+            self.buffers = [np.empty(shape, dtype=np.uint8) for _ in range(self.size)]
+        self._index = (self._index + 1) % self.size
+        return self.buffers[self._index]
+
 
 class FaceTracker:
-    def __init__(self):
+    def __init__(self, inference_backend: str = FACE_INFERENCE_BACKEND,
+                 inference_width: Optional[int] = INFERENCE_WIDTH,
+                 tracking_profile: str = TRACKING_PROFILE,
+                 input_source: Optional[InputSource] = None,
+                 profiler: Optional[Profiler] = None):
         mediapipe_resource_path = resource_path(FRONT_CPU_BINARYPB)
-        self.face_mesh = face_mesh.FaceMesh(
-            max_num_faces=1,
-            refine_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5,
-            binary_graph_path=mediapipe_resource_path
-        )
-        self.video_capture = cv.VideoCapture(0, cv.CAP_DSHOW)
+        self.face_mesh = None
+        self.inference_process = None
+        if inference_backend == "process":
+            self.inference_process = FaceMeshProcess(
+                mediapipe_resource_path,
+                NOSE_LANDMARK_INDEX,
+                tracking_profile=tracking_profile,
+                min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+                min_tracking_confidence=MIN_TRACKING_CONFIDENCE
+            )
+        elif inference_backend == "inline":
+            self.face_mesh = face_mesh.FaceMesh.from_profile(
+                tracking_profile,
+                max_num_faces=1,
+                min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+                min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
+                binary_graph_path=mediapipe_resource_path
+            )
+        else:
+            raise ValueError(f"Unknown face inference backend: {inference_backend!r}")
+        # Frames come from a live camera unless a recorded or synthetic source is given
+        self.video_capture = input_source if input_source is not None else CameraSource()
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
+        self.frame_ring = FrameRing()
+        self._raw_frame = None
+        self._unflipped_frame = None
+        self.inference_width = inference_width
+        self._inference_frame = None
         print((
             self.video_capture.get(cv.CAP_PROP_FRAME_WIDTH),
             self.video_capture.get(cv.CAP_PROP_FRAME_HEIGHT),
         ))
 
+    def request_resolution(self, size: tuple):
+        """Ask the input source for a capture size; it may pick the closest it supports."""
+        self.video_capture.set(cv.CAP_PROP_FRAME_WIDTH, size[0])
+        self.video_capture.set(cv.CAP_PROP_FRAME_HEIGHT, size[1])
+
+    @property
+    def resolution(self) -> tuple:
+        return (
+            self.video_capture.get(cv.CAP_PROP_FRAME_WIDTH),
+            self.video_capture.get(cv.CAP_PROP_FRAME_HEIGHT),
+        )
+
+    def _inference_input(self, frame):
+        """Downscale the display frame to the inference width, keeping its aspect ratio.
+
+        Landmarks are normalized to the image size, so positions found on the
+        smaller frame apply unchanged to the full-resolution one.
+        """
+        height, width = frame.shape[:2]
+        if not self.inference_width or width <= self.inference_width:
+            return frame
+        size = (self.inference_width, max(1, round(height * self.inference_width / width)))
+        self._inference_frame = cv.resize(frame, size, self._inference_frame, interpolation=cv.INTER_AREA)
+        return self._inference_frame
+
+    def _landmark_y(self, rgb_frame):
+        if self.inference_process is not None:
+            return self.inference_process.landmark_y(rgb_frame)
+        results = self.face_mesh.process(rgb_frame)
+        if results.multi_face_landmarks:
+            return results.multi_face_landmarks[0].landmark[NOSE_LANDMARK_INDEX].y
+        return None
+
     def get_face_position(self):
-        ret, frame = self.video_capture.read()
+        """Return the tracked landmark height and the mirrored RGB camera frame.
+
+        The frame is converted to RGB exactly once, into a buffer from the frame
+        ring; that full-resolution buffer is displayed while a downscaled copy
+        is used for inference.
+        """
+        with self.profiler.stage("capture"):
+            ret, self._raw_frame = self.video_capture.read(self._raw_frame)
         if not ret:
             return None, None
 
-        frame = cv.flip(frame, 1)
-        results = self.face_mesh.process(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
-
-        if results.multi_face_landmarks:
-            landmark = results.multi_face_landmarks[0].landmark[94]
-            return landmark.y, frame
-        return None, frame
+        with self.profiler.stage("color"):
+            self._unflipped_frame = cv.cvtColor(self._raw_frame, cv.COLOR_BGR2RGB, self._unflipped_frame)
+            frame = self.frame_ring.next(self._unflipped_frame.shape)
+            cv.flip(self._unflipped_frame, 1, frame)
+        with self.profiler.stage("inference"):
+            position = self._landmark_y(self._inference_input(frame))
+        return position, frame
 
     def release(self):
         self.video_capture.release()
-        cv.destroyAllWindows()
\ No newline at end of file
+        if self.inference_process is not None:
+            self.inference_process.close()
+            self.inference_process = None
+        cv.destroyAllWindows()
+
+
+class AsyncFaceTracker:
+    """Runs a FaceTracker on a background thread and keeps only its newest sample.
+
+    The worker publishes each result by rebinding a single attribute to an
+    immutable FaceSample, so readers never block and never see a torn sample.
+    """
+
+    def __init__(self, face_tracker: FaceTracker):
+        self.face_tracker = face_tracker
+        self._latest = FaceSample(None, None, 0.0)
+        self._is_running = False
+        self._worker_thread = None
+
+    @property
+    def video_capture(self):
+        return self.face_tracker.video_capture
+
+    @property
+    def frame_ring(self) -> FrameRing:
+        return self.face_tracker.frame_ring
+
+    @property
+    def profiler(self) -> Profiler:
+        return self.face_tracker.profiler
+
+    @property
+    def latest(self) -> FaceSample:
+        """The most recently published sample."""
+        return self._latest
+
+    def _capture_loop(self):
+        """Private method to capture and track frames until stopped."""
+        while self._is_running:
+            captured_at = time.monotonic()
+            try:
+                position, frame = self.face_tracker.get_face_position()
+            except InferenceWorkerError as e:
+                # Retrying would only repeat the error every frame
+                print(f"Face tracking stopped: {e}")
+                self._is_running = False
+                break
+            except Exception as e:
+                print(f"Error during face tracking: {e}")
+                time.sleep(0.01)
+                continue
+            if frame is None:
+                # Camera hiccup; avoid spinning on a dead capture device
+                time.sleep(0.005)
+                continue
+            self._latest = FaceSample(position, frame, captured_at)
+
+    def start(self):
+        """Starts the capture and inference worker."""
+        if not self._is_running:
+            self._is_running = True
+            self._worker_thread = threading.Thread(target=self._capture_loop, daemon=True)
+            self._worker_thread.start()
+
+    def stop(self):
+        """Stops the worker and waits for the in-flight frame to finish."""
+        if self._is_running:
+            self._is_running = False
+            if self._worker_thread:
+                self._worker_thread.join()
+            self._worker_thread = None
+
+    def get_face_position(self):
+        sample = self._latest
+        return sample.position, sample.frame
+
+    def release(self):
+        self.stop()
+        self.face_tracker.release()
@@ -1,8 +1,10 @@
+import importlib
+import multiprocessing
+import threading
 import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk
-import pandas as pd
-from typing import List, Optional, Dict, Any
+from typing import Optional, Dict, Any, TYPE_CHECKING
 from screeninfo import get_monitors
 import pyglet
 
@@ -14,73 +16,87 @@ from flappy.constants import (
     BACKGROUND_COLOR,
     TEXT_COLOR,
     EXCEL_FILE_PATH,
+    LEADERBOARD_DB_PATH,
+    LEADERBOARD_JOURNAL_PATH,
+    LEADERBOARD_EXPORT_PATH,
     LOGO_IMAGE_PATH,
     FONT_FILE_PATH,
     ICON,
-    CONSOLE_BLUE, JURASSIC_PARK_THEME
+    CONSOLE_BLUE, JURASSIC_PARK_THEME,
+    CLASS_OPTIONS,
+    GAME_SESSION_MODE,
+    PREWARM_AT_IDLE_MS
 )
 
-# Game components
-from flappy.GameEngine import run_game
+# Game components; the game engine itself is imported on first use
 from flappy.UserForm import UserForm
 from flappy.credits import show_credits_popup
+from flappy.LeaderboardStore import open_leaderboard_store
+from flappy.LeaderboardWriter import LeaderboardWriter
+from flappy.RankedLeaderboard import GroupedLeaderboard, RankChange, ALL_PLAYERS
+from flappy.VirtualLeaderboard import VirtualLeaderboard
 
+if TYPE_CHECKING:
+    from flappy.GameEngine import GameSession
+
+
+def _game_engine():
+    """Import the game engine module, which pulls in pygame, OpenCV and MediaPipe."""
+    return importlib.import_module("flappy.GameEngine")
 
-def _manage_leaderboard(user_data: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-    """Manage leaderboard data by reading, updating, and returning leaderboard records."""
-    try:
-        # Read existing leaderboard data
-        try:
-            df: pd.DataFrame = pd.read_excel(
-                Flappy.excel_file, engine="openpyxl", converters={"Class": str, "Section": str}
-            )
-            df.fillna("Not Applicable", inplace=True)
-        except FileNotFoundError:
-            print("Leaderboard file not found. Initializing a new leaderboard.")
-            df = pd.DataFrame(columns=["Type", "Name", "Class", "Section", "Score"])
-
-        # Update leaderboard with new user data
-        if user_data:
-            new_entry: Dict[str, Any] = {
-                "Type": user_data["Role"],
-                "Name": user_data["Name"],
-                "Class": user_data.get("Class", "N/A"),
-                "Section": user_data.get("Section", "N/A"),
-                "Score": user_data["Score"],
-            }
-            df = pd.concat([df, pd.DataFrame([new_entry])], ignore_index=True)
-            df.sort_values("Score", ascending=False, inplace=True)
-            df.drop_duplicates(subset=["Name", "Class", "Section"], keep="first", inplace=True)
-            df.to_excel(Flappy.excel_file, index=False, engine="openpyxl")
-            print("Leaderboard updated successfully.")
-
-        # Convert leaderboard to a list of dictionaries
-        return df.sort_values("Score", ascending=False).to_dict(orient="records")
-    except Exception as e:
-        print(f"Error managing leaderboard: {e}")
-        return []
+
+def _leaderboard_entry(user_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a leaderboard record from the player's form data and score."""
+    return {
+        "Type": user_data["Role"],
+        "Name": user_data["Name"],
+        "Class": user_data.get("Class", "N/A"),
+        "Section": user_data.get("Section", "N/A"),
+        "Score": user_data["Score"],
+    }
 
 
 class Flappy:
     """Main class for the Flappy game."""
     excel_file: str = EXCEL_FILE_PATH
+    leaderboard_db: str = LEADERBOARD_DB_PATH
+    leaderboard_journal: str = LEADERBOARD_JOURNAL_PATH
+    leaderboard_export: str = LEADERBOARD_EXPORT_PATH
     logo_path: str = LOGO_IMAGE_PATH
     font_file: str = FONT_FILE_PATH
     def __init__(self, root: tk.Tk) -> None:
         self.root: tk.Tk = root
         self.music_player = MusicPlayer(JURASSIC_PARK_THEME)
         self.music_player.play()
-        self.leaderboard_data: List[Dict[str, Any]] = []
+        self.leaderboard_data: GroupedLeaderboard = GroupedLeaderboard()
+        self.game_session: Optional["GameSession"] = None
 
         # Configure the root window
         self._configure_window()
 
-        # Load leaderboard data
-        self.leaderboard_data = _manage_leaderboard()
+        # Load leaderboard data; later writes happen off the Tk thread
+        self.leaderboard_writer = LeaderboardWriter(
+            Flappy.leaderboard_db, Flappy.leaderboard_export, Flappy.leaderboard_journal
+        )
+        try:
+            store = open_leaderboard_store(Flappy.leaderboard_db, Flappy.excel_file)
+            try:
+                self.leaderboard_writer.recover(store)
+                self.leaderboard_data = GroupedLeaderboard(store.top())
+            finally:
+                store.close()
+        except Exception as e:
+            print(f"Error opening leaderboard: {e}")
+        self.leaderboard_writer.start()
 
         # Create UI components
         self._create_widgets()
 
+        # Load the game engine's heavy modules once the menu is up, not before it
+        self.root.after_idle(lambda: threading.Thread(target=_game_engine, daemon=True).start())
+        if GAME_SESSION_MODE and PREWARM_AT_IDLE_MS is not None:
+            self.root.after(PREWARM_AT_IDLE_MS, self._prewarm_game)
+
     def _configure_window(self) -> None:
         """Configure the root window's settings."""
         self.root.configure(background=BACKGROUND_COLOR)
@@ -292,40 +308,64 @@ class Flappy:
         leaderboard_frame = ttk.Frame(self.root)
         leaderboard_frame.grid(row=3, column=0, padx=20, pady=20)
 
-        self.leaderboard = ttk.Treeview(leaderboard_frame, columns=columns, show="headings")
-        for column in columns:
-            self.leaderboard.heading(column, text=column)
-            self.leaderboard.column(column)
+        # Selector for the overall, per-role and per-class leaderboards
+        self.leaderboard_view = tk.StringVar(value=ALL_PLAYERS)
+        self.view_selector = ttk.Combobox(
+            leaderboard_frame,
+            textvariable=self.leaderboard_view,
+            state="readonly",
+            font=("Courier", 16),
+        )
+        self.view_selector.bind("<<ComboboxSelected>>", lambda event: self._update_leaderboard())
+        self.view_selector.grid(row=0, column=0, pady=(0, 10), sticky="w")
 
-        # Scrollbar for the leaderboard
-        v_scrollbar = ttk.Scrollbar(leaderboard_frame, orient="vertical", command=self.leaderboard.yview)
-        self.leaderboard.configure(yscrollcommand=v_scrollbar.set)
+        table_frame = ttk.Frame(leaderboard_frame)
+        table_frame.grid(row=1, column=0, sticky="nsew")
 
-        # Place Treeview and scrollbar
-        self.leaderboard.grid(row=0, column=0, sticky="nsew")
-        v_scrollbar.grid(row=0, column=1, sticky="ns")
+        # Only the rows in view are materialized, however long the leaderboard grows
+        self.leaderboard = VirtualLeaderboard(table_frame, columns, self.leaderboard_data.overall)
 
-        leaderboard_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_rowconfigure(0, weight=1)
+        table_frame.grid_columnconfigure(0, weight=1)
+        leaderboard_frame.grid_rowconfigure(1, weight=1)
         leaderboard_frame.grid_columnconfigure(0, weight=1)
 
         # Load and display leaderboard data
         self._update_leaderboard()
 
     def _update_leaderboard(self) -> None:
-        """Update the leaderboard with current data."""
-        self.leaderboard.delete(*self.leaderboard.get_children())
-        for entry in self.leaderboard_data:
-            values = (
-                entry["Type"],
-                entry["Name"],
-                entry.get("Class", ""),
-                entry.get("Section", ""),
-                entry["Score"],
-            )
-            self.leaderboard.insert("", tk.END, values=values)
+        """Show the selected leaderboard view from its precomputed index."""
+        self.view_selector.configure(values=self.leaderboard_data.names(CLASS_OPTIONS))
+        view = self.leaderboard_data.views.get(self.leaderboard_view.get())
+        if view is None:
+            self.leaderboard_view.set(ALL_PLAYERS)
+            view = self.leaderboard_data.overall
+        if view is not self.leaderboard.data_source:
+            self.leaderboard.set_data_source(view)
+        else:
+            self.leaderboard.refresh()
+
+    def _apply_rank_change(self, change: RankChange) -> None:
+        """Show the row of the player whose rank changed in the selected view."""
+        self._update_leaderboard()
+        rank = self.leaderboard.data_source.rank_of(change.player)
+        if rank is not None:
+            self.leaderboard.show_rank(rank)
+
+    def _get_game_session(self) -> "GameSession":
+        if self.game_session is None:
+            self.game_session = _game_engine().GameSession()
+        return self.game_session
+
+    def _prewarm_game(self) -> None:
+        """Open the camera and build the face tracker while the menu is in use."""
+        if GAME_SESSION_MODE:
+            self._get_game_session().prewarm((self.window_width, self.window_height))
 
     def _start_game(self) -> None:
         """Start the game by opening the user form."""
+        # The player typing their details hides the tracker's start-up time
+        self._prewarm_game()
         root: tk.Toplevel = tk.Toplevel(self.root)
         UserForm(root, self._process_user_input)
 
@@ -339,18 +379,31 @@ class Flappy:
         root: tk.Toplevel = tk.Toplevel(self.root)
         show_credits_popup(root)
 
+    def close(self) -> None:
+        """Release the game session and wait for pending leaderboard writes."""
+        if self.game_session is not None:
+            self.game_session.close()
+        self.leaderboard_writer.close()
+
     def _process_user_input(self, user_data: Dict[str, Any]) -> None:
         """Process user input and update the leaderboard."""
         self.root.withdraw()
+        change: Optional[RankChange] = None
         try:
             self.music_player.stop()
-            score: int = run_game()
+            if GAME_SESSION_MODE:
+                score: int = self._get_game_session().play()
+            else:
+                score = _game_engine().run_game()
             self.music_player.play()
             user_data["Score"] = score
-            self.leaderboard_data = _manage_leaderboard(user_data)
+            entry = _leaderboard_entry(user_data)
+            self.leaderboard_writer.submit(entry)
+            change = self.leaderboard_data.insert_or_improve(entry)
         finally:
             self.root.deiconify()
-            self._update_leaderboard()
+            if change is not None:
+                self._apply_rank_change(change)
 
 
 def main() -> None:
@@ -358,9 +411,12 @@ def main() -> None:
     root: tk.Tk = tk.Tk()
     icon = tk.PhotoImage(file=ICON)
     root.iconphoto(False, icon)
-    Flappy(root)
+    flappy = Flappy(root)
     root.mainloop()
+    flappy.close()
 
 
 if __name__ == "__main__":
+    # Required for the face inference worker process in frozen builds
+    multiprocessing.freeze_support()
     main()
@@ -1,90 +1,289 @@
+import os
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
 import pygame
-import cv2 as cv
 from pygame import SurfaceType
 from pygame.mixer import SoundType
 from pygame.rect import RectType
 
 from flappy.LoadingBar import LoadingBar
+from flappy.AssetCache import load_game_over_logo, prebake
 from flappy.Bird import Bird
 from flappy.Pipes import Pipes
-from flappy.FaceTracker import FaceTracker
+from flappy.TextCache import TextCache
+from flappy.Profiler import Profiler
+from flappy.FaceTracker import FaceTracker, AsyncFaceTracker
 from flappy.constants import (
     ICON,
+    ASYNC_FACE_TRACKING,
+    RENDER_MODE,
+    CAMERA_REFRESH_INTERVAL,
+    CAMERA_BACKGROUND_DIM,
+    STAGE_INTERVAL,
+    SIMULATION_STEP,
+    MAX_SIMULATION_STEPS,
+    HEADLESS_WINDOW_SIZE,
+    PERFORMANCE_OVERLAY,
+    PROFILER_SAMPLES,
+    PROFILE_CSV_PATH,
     LOGO_IMAGE_PATH,
     FLYING_SOUND,
-    CRASH_SOUND,
-    GAME_OVER_LOGO_PATH)
+    CRASH_SOUND)
+
+
+def _no_progress(value, message):
+    """Stands in for LoadingBar when running headless."""
+
+
+@contextmanager
+def _dummy_sdl_drivers():
+    """Select SDL's dummy video and audio drivers only while pygame initializes.
+
+    SDL reads the variables at init time, so restoring them afterwards keeps
+    later engines in the same process on the real display and audio device.
+    """
+    previous = {name: os.environ.get(name) for name in ("SDL_VIDEODRIVER", "SDL_AUDIODRIVER")}
+    os.environ.update(dict.fromkeys(previous, "dummy"))
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
 
 
 class GameEngine:
-    def __init__(self):
-        self.loading_bar: LoadingBar = LoadingBar()
-        pygame.init()
+    # Upper bound on cached camera frame wrappers (a few frame ring generations)
+    MAX_FRAME_SURFACES = 8
+
+    def __init__(self, async_tracking: bool = ASYNC_FACE_TRACKING, render_mode: str = RENDER_MODE,
+                 headless: bool = False, face_tracker=None, window_size: Optional[tuple] = None,
+                 seed: Optional[int] = None, profiler: Optional[Profiler] = None,
+                 profile_csv_path: Optional[str] = PROFILE_CSV_PATH,
+                 prepared_tracker: Optional[FaceTracker] = None):
+        """Set up the game window, assets and face tracking.
+
+        headless runs without a real display, audio device or loading window and
+        steps the simulation as fast as the CPU allows. face_tracker injects any
+        object with get_face_position() and release() in place of the camera;
+        headless mode requires one. seed makes the pipe layout reproducible.
+        profiler replaces the default one that keeps recent stage timings for the
+        performance overlay; profile_csv_path receives its samples on exit.
+        prepared_tracker is a camera FaceTracker already opened and set to the
+        window size, e.g. by TrackerWarmer, used in place of creating one.
+        """
+        self.headless = headless
+        self.profiler = profiler if profiler is not None else Profiler(max_samples=PROFILER_SAMPLES)
+        self.profile_csv_path = profile_csv_path
+        if headless:
+            if face_tracker is None:
+                raise ValueError("Headless mode needs an injected face_tracker")
+            self.loading_bar = _no_progress
+            with _dummy_sdl_drivers():
+                pygame.init()
+        else:
+            self.loading_bar: LoadingBar = LoadingBar()
+            pygame.init()
         self.loading_bar(10, "Loading assets...")
         self.crash_sound: SoundType = pygame.mixer.Sound(CRASH_SOUND)
         pygame.display.set_icon(pygame.image.load(ICON))
         info_object = pygame.display.Info()
-        self.window_size = (
-            info_object.current_w,
-            info_object.current_h
-        )
+        if window_size is None:
+            window_size = HEADLESS_WINDOW_SIZE if headless else (info_object.current_w, info_object.current_h)
+        self.window_size = window_size
         self.logo: SurfaceType = pygame.image.load(LOGO_IMAGE_PATH)
         self.font = pygame.font.SysFont("Helvetica Bold", 30)
-        scaled_width = int(self.window_size[0] * 0.25)
-        scaled_height = int(self.window_size[1] * 0.25)
-        self.game_over_logo = pygame.transform.scale(pygame.image.load(GAME_OVER_LOGO_PATH),
-                                                     (scaled_width, scaled_height))
+        self.text_cache = TextCache(self.font)
         self.loading_bar(20, "Setting up face tracker...")
-        self.face_tracker = FaceTracker()
-        self.loading_bar(50, "Determining camera resolution...")
-        self.face_tracker.video_capture.set(cv.CAP_PROP_FRAME_WIDTH, info_object.current_w)
-        self.face_tracker.video_capture.set(cv.CAP_PROP_FRAME_HEIGHT, info_object.current_h)
-        self.loading_bar(60, "Setting screen resolution...")
-        camera_resolution = (
-            self.face_tracker.video_capture.get(cv.CAP_PROP_FRAME_WIDTH),
-            self.face_tracker.video_capture.get(cv.CAP_PROP_FRAME_HEIGHT),
-        )
-        self.loading_bar(70, "Setting mode...")
-        if self.window_size > camera_resolution:
-            self.window_size = camera_resolution
-            self.screen = pygame.display.set_mode(self.window_size, pygame.NOFRAME)
+        if face_tracker is None:
+            if prepared_tracker is None:
+                self.face_tracker = FaceTracker(profiler=self.profiler)
+                self.loading_bar(50, "Determining camera resolution...")
+                self.face_tracker.request_resolution(self.window_size)
+            else:
+                self.face_tracker = prepared_tracker
+                self.face_tracker.profiler = self.profiler
+            self.loading_bar(60, "Setting screen resolution...")
+            camera_resolution = self.face_tracker.resolution
+            self.loading_bar(70, "Setting mode...")
+            if self.window_size > camera_resolution:
+                self.window_size = camera_resolution
+                self.display_flags = pygame.NOFRAME
+            else:
+                self.display_flags = 0
         else:
-            self.screen = pygame.display.set_mode(self.window_size)
+            # An injected source has no camera resolution to negotiate
+            self.face_tracker = face_tracker
+            self.display_flags = 0
+        self.screen = pygame.display.set_mode(self.window_size, self.display_flags)
         self.loading_bar(80, "Initializing game components...")
         pygame.display.set_caption("Flappy Bird with Face Tracking")
+        if async_tracking and face_tracker is None:
+            # Start only after the camera resolution has been negotiated. Injected
+            # sources are stepped synchronously so simulations stay deterministic.
+            self.face_tracker = AsyncFaceTracker(self.face_tracker)
+            self.face_tracker.start()
 
+        self.game_over_logo: SurfaceType = load_game_over_logo(self.window_size)
         self.bird = Bird(self.window_size)
-        self.pipes = Pipes(self.window_size)
+        self.pipes = Pipes(self.window_size, seed)
         self.clock = pygame.time.Clock()
 
         self.loading_bar(90, "Finalizing...")
         self.running = True
         self.score = 0
         self.stage = 1
-        self.last_stage_time = time.time()
+        # Simulated seconds since the game started; gameplay never reads the wall clock
+        self.simulated_time = 0.0
+        self.time_accumulator = 0.0
+        self.last_stage_time = 0.0
         self.leaderboard = []
         self.did_update_score = False
+        # Surfaces wrapping the tracker's frame buffers, keyed by buffer id
+        self.frame_surfaces: dict = {}
+        if render_mode not in ("full", "dirty"):
+            raise ValueError(f"Unknown render mode: {render_mode!r}")
+        self.render_mode = render_mode
+        # Dirty mode: camera image that sprites are erased back to, and last frame's rects
+        self.background: SurfaceType = None
+        self.dirty_rects: list = []
+        self.frame_index = 0
+        # Work time per frame in seconds, excluding the frame-rate limiter's sleep
+        self.frame_times: deque = deque(maxlen=600)
+        self.show_performance_overlay = PERFORMANCE_OVERLAY
+        self.performance_lines: list = []
+        # Frames that took noticeably longer than the 60 FPS budget
+        self.dropped_frames = 0
+        # Ends a game after this many rendered frames, e.g. for benchmarks; None plays it out
+        self.frame_limit: Optional[int] = None
 
-        self.start_time = time.time()  # Track game start time
         self.countdown_duration = 2 * 60  # Countdown timer: 2 minutes
+        self.remaining_time = self.countdown_duration
 
     def display_text(self, text, position, color=(0, 0, 0)):
-        rendered_text = self.font.render(text, True, color)
+        rendered_text = self.text_cache.render(text, color)
         rect = rendered_text.get_rect(center=position)
-        self.screen.blit(rendered_text, rect)
+        return self.screen.blit(rendered_text, rect)
+
+    def camera_surface(self, frame) -> SurfaceType:
+        """Wrap an RGB camera frame in a surface without copying it.
+
+        Each frame ring buffer is wrapped once with pygame.image.frombuffer; the
+        wrapping surface sees new pixels as the tracker rewrites the buffer.
+        """
+        key = id(frame)
+        cached = self.frame_surfaces.get(key)
+        if cached is None or cached[0] is not frame:
+            if len(self.frame_surfaces) >= GameEngine.MAX_FRAME_SURFACES:
+                # The ring was reallocated (resolution change); drop stale wrappers
+                self.frame_surfaces.clear()
+            height, width = frame.shape[:2]
+            # Keep a reference to the buffer so its id cannot be reused
+            cached = (frame, pygame.image.frombuffer(frame, (width, height), "RGB"))
+            self.frame_surfaces[key] = cached
+        return cached[1]
+
+    def draw_camera_frame(self, frame):
+        self.screen.blit(self.camera_surface(frame), (0, 0))
+
+    def draw_hud(self) -> list:
+        minutes = int(self.remaining_time // 60)
+        seconds = int(self.remaining_time % 60)
+        return [
+            self.display_text(f"Timer: {minutes:02}:{seconds:02}", (self.window_size[0] - 150, 100), (176, 20, 41)),
+            self.display_text(f"Score: {self.score}", (100, 50), (176, 20, 41)),
+            self.display_text(f"Stage: {self.stage}", (100, 100), (176, 20, 41)),
+        ]
+
+    def update_performance_lines(self):
+        def stage_ms(profiler, name):
+            value = profiler.percentile_ms(name, 0.5)
+            return "--" if value is None else f"{value:.1f} ms"
+
+        tracker_profiler = getattr(self.face_tracker, "profiler", self.profiler)
+        self.performance_lines = [
+            f"FPS: {self.clock.get_fps():.0f}",
+            f"Frame: {stage_ms(self.profiler, 'frame')}",
+            f"Camera age: {stage_ms(self.profiler, 'camera_age')}",
+            f"Inference: {stage_ms(tracker_profiler, 'inference')}",
+            f"Dropped: {self.dropped_frames}",
+        ]
+
+    def draw_performance_overlay(self) -> list:
+        """Draw FPS, median latencies and dropped frames in the bottom-left corner."""
+        # Refreshing the text a few times a second keeps it readable and cached
+        if self.frame_index % 15 == 0 or not self.performance_lines:
+            self.update_performance_lines()
+        dirty_rects = []
+        y = self.window_size[1] - 25 * len(self.performance_lines)
+        for line in self.performance_lines:
+            rendered_text = self.text_cache.render(line, (255, 255, 0))
+            dirty_rects.append(self.screen.blit(rendered_text, (10, y)))
+            y += 25
+        return dirty_rects
+
+    def draw_scene(self) -> list:
+        """Draw the sprites and HUD over the background and return the rects touched."""
+        dirty_rects = [self.bird.draw(self.screen)]
+        dirty_rects.extend(self.pipes.draw(self.screen))
+        dirty_rects.extend(self.draw_hud())
+        if self.show_performance_overlay:
+            dirty_rects.extend(self.draw_performance_overlay())
+        return dirty_rects
+
+    def render_full(self, frame):
+        with self.profiler.stage("render"):
+            if frame is not None:
+                self.draw_camera_frame(frame)
+            self.draw_scene()
+        with self.profiler.stage("flip"):
+            pygame.display.flip()
+
+    def render_dirty(self, frame):
+        """Redraw only what changed, refreshing the camera background every few frames.
+
+        Between refreshes, sprites are erased by copying the stored background
+        back over last frame's rects, and only those rects plus the new ones are
+        sent to the display.
+        """
+        refresh = self.background is None or (
+            frame is not None and CAMERA_REFRESH_INTERVAL > 0 and self.frame_index % CAMERA_REFRESH_INTERVAL == 0)
+        if refresh:
+            with self.profiler.stage("render"):
+                if self.background is None:
+                    self.background = pygame.Surface(self.window_size)
+                    self.background.fill((0, 0, 0))
+                if frame is not None:
+                    self.background.blit(self.camera_surface(frame), (0, 0))
+                    if CAMERA_BACKGROUND_DIM:
+                        dim = (CAMERA_BACKGROUND_DIM,) * 3
+                        self.background.fill(dim, special_flags=pygame.BLEND_RGB_SUB)
+                self.screen.blit(self.background, (0, 0))
+                self.dirty_rects = self.draw_scene()
+            with self.profiler.stage("flip"):
+                pygame.display.flip()
+            return
+
+        with self.profiler.stage("render"):
+            for rect in self.dirty_rects:
+                self.screen.blit(self.background, rect, rect)
+            dirty_rects = self.draw_scene()
+        with self.profiler.stage("flip"):
+            pygame.display.update(self.dirty_rects + dirty_rects)
+        self.dirty_rects = dirty_rects
 
     def check_collisions(self):
-        def pixel_perfect_collision(rect1: RectType, rect2: RectType, surface1: SurfaceType, surface2: SurfaceType):
+        def pixel_perfect_collision(rect1: RectType, rect2: RectType, mask1, mask2):
             """
             Check for pixel-perfect collision between two rectangles.
             rect1, rect2: pygame.Rect objects for the two rectangles.
-            surface1, surface2: pygame.Surface objects for the two images.
+            mask1, mask2: precomputed pygame.mask.Mask objects for the two images.
             """
-            # Create masks for each surface
-            mask1 = pygame.mask.from_surface(surface1)
-            mask2 = pygame.mask.from_surface(surface2)
-
             # Calculate the offset between the two rectangles
             offset = (rect2.x - rect1.x, rect2.y - rect1.y)
 
@@ -94,8 +293,8 @@ class GameEngine:
         for top, bottom in self.pipes.pipes:
             if self.bird.rect.colliderect(top) or self.bird.rect.colliderect(bottom):
                 # Perform pixel-perfect collision detection
-                if pixel_perfect_collision(self.bird.rect, top, self.bird.frame, self.pipes.top_image) or \
-                        pixel_perfect_collision(self.bird.rect, bottom, self.bird.frame, self.pipes.bottom_image):
+                if pixel_perfect_collision(self.bird.rect, top, self.bird.mask, self.pipes.top_mask) or \
+                        pixel_perfect_collision(self.bird.rect, bottom, self.bird.mask, self.pipes.bottom_mask):
                     # Handle collision
                     pygame.mixer.music.stop()
                     self.crash_sound.play()
@@ -103,6 +302,7 @@ class GameEngine:
                     return
 
     def update_score(self):
+        """Count a point once per pipe pair the bird passes; drawing is left to Pipes.draw."""
         checker = True
         for top, bottom in self.pipes.pipes:
             if top.left <= self.bird.rect.x <= top.right:
@@ -110,22 +310,59 @@ class GameEngine:
                 if not self.did_update_score:
                     self.score += 1
                     self.did_update_score = True
-            self.screen.blit(self.pipes.bottom_image, bottom)
-            self.screen.blit(pygame.transform.flip(self.pipes.bottom_image, False, True), top)
         if checker:
             self.did_update_score = False
 
     def update_timer(self):
-        elapsed_time = time.time() - self.start_time
-        remaining_time = max(0, int(self.countdown_duration - elapsed_time))
-        minutes = int(remaining_time // 60)
-        seconds = int(remaining_time % 60)
-        timer_text = f"{minutes:02}:{seconds:02}"
-        self.display_text(f"Timer: {timer_text}", (self.window_size[0] - 150, 100), (176, 20, 41))
-
-        if remaining_time == 0:
+        self.remaining_time = max(0, int(self.countdown_duration - self.simulated_time))
+
+        if self.remaining_time == 0:
             self.running = False
 
+    def update_stage(self):
+        if self.simulated_time - self.last_stage_time > STAGE_INTERVAL:
+            self.stage += 1
+            self.pipes.spawn_interval *= 5 / 6
+            self.last_stage_time = self.simulated_time
+
+    def step_simulation(self):
+        """Advance the game by one fixed SIMULATION_STEP."""
+        self.simulated_time += SIMULATION_STEP
+        with self.profiler.stage("physics"):
+            self.pipes.update()
+        with self.profiler.stage("collision"):
+            self.check_collisions()
+        self.update_score()
+        self.update_timer()
+        self.update_stage()
+
+    def advance_simulation(self, delta_time: float):
+        """Run as many fixed steps as the elapsed real time calls for.
+
+        Gameplay advances in simulated time regardless of the frame rate, so a
+        slow frame is caught up with extra steps instead of slowing the pipes.
+        Beyond MAX_SIMULATION_STEPS the backlog is dropped to stay responsive.
+        """
+        self.time_accumulator += delta_time
+        steps = 0
+        while self.running and self.time_accumulator >= SIMULATION_STEP:
+            if steps == MAX_SIMULATION_STEPS:
+                self.time_accumulator = 0.0
+                break
+            self.step_simulation()
+            self.time_accumulator -= SIMULATION_STEP
+            steps += 1
+
+    def frame_time_summary(self) -> str:
+        """Describe the recent per-frame work time, e.g. to compare render changes."""
+        if not self.frame_times:
+            return "No frames recorded."
+        samples = sorted(self.frame_times)
+        average = sum(samples) / len(samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        return (f"Frame time over {len(samples)} frames: "
+                f"avg {average * 1000:.2f} ms, p95 {p95 * 1000:.2f} ms, max {samples[-1] * 1000:.2f} ms")
+
     def game_over_screen(self):
         logo_rect = self.game_over_logo.get_rect(center=(self.window_size[0] // 2, self.window_size[1] // 2))
         self.screen.blit(self.game_over_logo, logo_rect)
@@ -144,16 +381,51 @@ class GameEngine:
                 if event.type == pygame.KEYDOWN:
                     return True  # Restart the game
 
-    def game_loop(self):
-        self.loading_bar(100, "Starting game...")
+    def reset_game_state(self):
+        """Return everything a single game changes to its starting values."""
         self.running = True
         self.score = 0
         self.stage = 1
-        self.pipes.pipes.clear()
-        self.pipes.spawn_timer = 0
+        self.did_update_score = False
+        self.pipes.reset()
+        self.frame_times.clear()
+        self.dropped_frames = 0
+        self.background = None
+        self.dirty_rects = []
+        self.frame_index = 0
+        self.simulated_time = 0.0
+        self.time_accumulator = 0.0
+        self.last_stage_time = 0.0
+        self.remaining_time = self.countdown_duration
+
+    def suspend(self):
+        """Idle between games: stop the tracking worker and minimize the window.
+
+        The camera, face mesh graph and loaded assets stay ready for resume().
+        """
+        if isinstance(self.face_tracker, AsyncFaceTracker):
+            self.face_tracker.stop()
+        pygame.mixer.music.stop()
+        pygame.display.iconify()
+
+    def resume(self):
+        """Bring the window back and restart tracking for another game."""
+        self.screen = pygame.display.set_mode(self.window_size, self.display_flags)
+        if isinstance(self.face_tracker, AsyncFaceTracker):
+            self.face_tracker.start()
+
+    def game_loop(self):
+        self.loading_bar(100, "Starting game...")
+        # The loading bar closes itself; later games in a session start without it
+        self.loading_bar = _no_progress
+        self.reset_game_state()
         pygame.mixer.music.load(FLYING_SOUND)
         pygame.mixer.music.play(-1)
+        # Discard the time spent outside the loop so the first step is not a catch-up
+        self.clock.tick()
+        delta_time = SIMULATION_STEP
         while self.running:
+            frame_start = time.perf_counter()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.cleanup()
@@ -162,41 +434,56 @@ class GameEngine:
                     if event.key == pygame.K_ESCAPE:
                         print("Escape key pressed. Exiting...")
                         self.cleanup()
-
-            face_position, frame = self.face_tracker.get_face_position()
-
+                    elif event.key == pygame.K_F3:
+                        self.show_performance_overlay = not self.show_performance_overlay
+
+            with self.profiler.stage("tracking"):
+                if isinstance(self.face_tracker, AsyncFaceTracker):
+                    face_position, frame, captured_at = self.face_tracker.latest
+                else:
+                    captured_at = time.monotonic()
+                    face_position, frame = self.face_tracker.get_face_position()
             if frame is not None:
-                frame = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
-                frame_surface = pygame.surfarray.make_surface(frame.swapaxes(0, 1))
-                self.screen.blit(frame_surface, (0, 0))
+                # How old the frame is when the game acts on it: capture, inference and queueing
+                self.profiler.record("camera_age", time.monotonic() - captured_at)
 
             if face_position is not None:
                 self.bird.move(face_position)
 
-            self.pipes.update()
-            self.check_collisions()
-            self.update_score()
-            self.update_timer()
-            self.bird.draw(self.screen)
-            self.pipes.draw(self.screen)
-
-            self.display_text(f"Score: {self.score}", (100, 50), (176, 20, 41))
-            self.display_text(f"Stage: {self.stage}", (100, 100), (176, 20, 41))
-
-            if time.time() - self.last_stage_time > 10:
-                self.stage += 1
-                self.pipes.spawn_interval *= 5 / 6
-                self.last_stage_time = time.time()
-
-            pygame.display.flip()
-            self.clock.tick(60)
-
+            self.advance_simulation(delta_time)
+            self.bird.animate(delta_time)
+
+            if self.render_mode == "dirty":
+                self.render_dirty(frame)
+            else:
+                self.render_full(frame)
+            self.frame_index += 1
+            if self.frame_limit is not None and self.frame_index >= self.frame_limit:
+                self.running = False
+            self.frame_times.append(time.perf_counter() - frame_start)
+            self.profiler.record("frame", self.frame_times[-1])
+            if self.headless:
+                # One fixed step per frame, without waiting for the frame rate limiter
+                delta_time = SIMULATION_STEP
+            else:
+                delta_time = self.clock.tick(60) / 1000
+                if delta_time > 1.5 / 60:
+                    self.dropped_frames += 1
+
+        print(self.frame_time_summary())
         # Add score to leaderboard
         self.leaderboard.append(self.score)
-        self.game_over_screen()
+        if not self.headless:
+            self.game_over_screen()
 
     def cleanup(self):
         self.face_tracker.release()
+        if self.profile_csv_path:
+            try:
+                self.profiler.write_csv(self.profile_csv_path)
+                print(f"Profiler samples written to {self.profile_csv_path}")
+            except OSError as e:
+                print(f"Error writing profiler samples: {e}")
         pygame.quit()
 
     def run(self):
@@ -213,5 +500,105 @@ def run_game():
     return score
 
 
+class TrackerWarmer:
+    """Opens the camera and builds the face mesh graph on a background thread.
+
+    Only the tracker is warmed this way: pygame's window and surfaces have to
+    be created on the main thread, but they are cheap next to the camera and
+    the MediaPipe graph. The scaled sprites for the negotiated window size are
+    baked into the asset cache, so the engine only has to wrap them.
+    """
+
+    def __init__(self, window_size: tuple):
+        self.window_size = window_size
+        self._face_tracker: Optional[FaceTracker] = None
+        self._warm_thread = threading.Thread(target=self._warm, daemon=True)
+
+    def _warm(self):
+        """Private method to build the tracker, negotiate its resolution and bake sprites."""
+        try:
+            face_tracker = FaceTracker()
+            face_tracker.request_resolution(self.window_size)
+            self._face_tracker = face_tracker
+        except Exception as e:
+            print(f"Error warming face tracker: {e}")
+            return
+        try:
+            # The engine shrinks the window to the camera resolution, as in GameEngine.__init__
+            window_size = min(self.window_size, face_tracker.resolution)
+            prebake(window_size)
+        except Exception as e:
+            print(f"Error baking game assets: {e}")
+
+    def start(self):
+        self._warm_thread.start()
+
+    def result(self) -> Optional[FaceTracker]:
+        """Wait for the warm-up; None if it failed and the engine should build its own."""
+        self._warm_thread.join()
+        return self._face_tracker
+
+    def discard(self):
+        """Release a warmed tracker that will not be used."""
+        face_tracker = self.result()
+        if face_tracker is not None:
+            face_tracker.release()
+
+
+class GameSession:
+    """Runs consecutive games on one GameEngine.
+
+    The engine is created on the first game and suspended between games, so the
+    camera, face mesh graph, sprites and sounds are only set up once per session.
+    """
+
+    def __init__(self):
+        self.engine: Optional[GameEngine] = None
+        self.warmer: Optional[TrackerWarmer] = None
+
+    def prewarm(self, window_size: tuple):
+        """Start preparing the face tracker in the background if no engine is ready."""
+        if self.engine is None and self.warmer is None:
+            self.warmer = TrackerWarmer(window_size)
+            self.warmer.start()
+
+    def play(self) -> int:
+        """Play one game and return its score."""
+        if self.engine is None:
+            prepared_tracker = None
+            if self.warmer is not None:
+                prepared_tracker = self.warmer.result()
+                self.warmer = None
+            self.engine = GameEngine(prepared_tracker=prepared_tracker)
+        else:
+            self.engine.resume()
+        try:
+            score = self.engine.run()
+            self.engine.suspend()
+        except BaseException:
+            # The engine is in an unknown state; the next game starts from scratch
+            self.close()
+            raise
+        return score
+
+    def close(self):
+        if self.warmer is not None:
+            self.warmer.discard()
+            self.warmer = None
+        if self.engine is not None:
+            self.engine.cleanup()
+            self.engine = None
+
+
+def run_headless_game(face_tracker, seed: Optional[int] = 0, window_size: Optional[tuple] = None) -> int:
+    """Play one game without display or camera, steering with face_tracker; returns the score."""
+    game = GameEngine(headless=True, face_tracker=face_tracker, window_size=window_size, seed=seed)
+    try:
+        score = game.run()
+    finally:
+        game.cleanup()
+    return score
+
+
 if __name__ == "__main__":
     run_game()
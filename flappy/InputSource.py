@@ -0,0 +1,139 @@
+import glob
+import math
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+import cv2 as cv
+import numpy as np
+
+
+class InputSource(ABC):
+    """Where FaceTracker reads its BGR frames from.
+
+    The interface is the subset of cv.VideoCapture that the game uses, so a
+    plain VideoCapture can stand in for any source.
+    """
+
+    @abstractmethod
+    def read(self, image=None):
+        """Return (ok, BGR frame); image is an optional buffer to read into."""
+
+    def get(self, prop_id: int) -> float:
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return False
+
+    def release(self):
+        pass
+
+
+class CameraSource(InputSource):
+    """A live camera."""
+
+    def __init__(self, index: int = 0, api_preference: int = cv.CAP_DSHOW):
+        self.video_capture = cv.VideoCapture(index, api_preference)
+
+    def read(self, image=None):
+        return self.video_capture.read(image)
+
+    def get(self, prop_id: int) -> float:
+        return self.video_capture.get(prop_id)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        return self.video_capture.set(prop_id, value)
+
+    def release(self):
+        self.video_capture.release()
+
+
+class VideoFileSource(InputSource):
+    """A recorded video, optionally rewound when it ends."""
+
+    def __init__(self, path: str, loop: bool = True):
+        self.path = path
+        self.loop = loop
+        self.video_capture = cv.VideoCapture(path)
+        if not self.video_capture.isOpened():
+            raise FileNotFoundError(f"Cannot open video: {path}")
+
+    def read(self, image=None):
+        ret, frame = self.video_capture.read(image)
+        if not ret and self.loop:
+            self.video_capture.set(cv.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.video_capture.read(image)
+        return ret, frame
+
+    def get(self, prop_id: int) -> float:
+        return self.video_capture.get(prop_id)
+
+    def set(self, prop_id: int, value: float) -> bool:
+        # A recording has a fixed resolution; ignore capture size requests
+        if prop_id in (cv.CAP_PROP_FRAME_WIDTH, cv.CAP_PROP_FRAME_HEIGHT):
+            return False
+        return self.video_capture.set(prop_id, value)
+
+    def release(self):
+        self.video_capture.release()
+
+
+class ImageSequenceSource(InputSource):
+    """Still images matched by a glob pattern, read in sorted order."""
+
+    def __init__(self, pattern: str, loop: bool = True):
+        self.paths = sorted(glob.glob(pattern))
+        if not self.paths:
+            raise FileNotFoundError(f"No images match: {pattern}")
+        self.loop = loop
+        self.index = 0
+        first_image = cv.imread(self.paths[0])
+        self.frame_size = (first_image.shape[1], first_image.shape[0])
+
+    def read(self, image=None):
+        if self.index >= len(self.paths):
+            if not self.loop:
+                return False, None
+            self.index = 0
+        frame = cv.imread(self.paths[self.index])
+        self.index += 1
+        return frame is not None, frame
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv.CAP_PROP_FRAME_WIDTH:
+            return float(self.frame_size[0])
+        if prop_id == cv.CAP_PROP_FRAME_HEIGHT:
+            return float(self.frame_size[1])
+        if prop_id == cv.CAP_PROP_POS_FRAMES:
+            return float(self.index)
+        return 0.0
+
+
+def sine_trajectory(period: int = 240, amplitude: float = 0.25) -> Callable[[int], Optional[float]]:
+    """A head bobbing up and down around mid-frame, one cycle per period frames."""
+    def position(frame_index: int) -> Optional[float]:
+        return 0.5 + amplitude * math.sin(2 * math.pi * frame_index / period)
+    return position
+
+
+class SyntheticFaceSource:
+    """Generates face positions from a trajectory instead of tracking a camera.
+
+    Follows the FaceTracker contract, get_face_position() -> (position, frame),
+    so it can be injected into GameEngine. Frames are a blank RGB image of
+    frame_size, or None when no frame_size is given.
+    """
+
+    def __init__(self, trajectory: Callable[[int], Optional[float]] = None, frame_size: Optional[tuple] = None):
+        self.trajectory = trajectory if trajectory is not None else sine_trajectory()
+        self.frame_index = 0
+        self.frame = None
+        if frame_size is not None:
+            self.frame = np.zeros((frame_size[1], frame_size[0], 3), dtype=np.uint8)
+
+    def get_face_position(self):
+        position = self.trajectory(self.frame_index)
+        self.frame_index += 1
+        return position, self.frame
+
+    def release(self):
+        pass
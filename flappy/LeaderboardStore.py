@@ -0,0 +1,108 @@
+import os
+import sqlite3
+from typing import List, Dict, Any, Optional
+
+COLUMNS = ["Type", "Name", "Class", "Section", "Score"]
+
+
+class LeaderboardStore:
+    """SQLite-backed leaderboard keeping each player's best score.
+
+    A player is identified by (Name, Class, Section). Upserts and top-N queries
+    go through indexes, so their cost grows with log(n) rather than with the
+    size of the table. Excel workbooks are only used for import and export.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS leaderboard (
+                type TEXT NOT NULL,
+                name TEXT NOT NULL,
+                class_name TEXT NOT NULL,
+                section TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                UNIQUE (name, class_name, section)
+            );
+            CREATE INDEX IF NOT EXISTS leaderboard_score ON leaderboard (score DESC);
+        """)
+
+    @staticmethod
+    def _row(record: Dict[str, Any]) -> Optional[tuple]:
+        """The table row for a record, or None if its score is not a number."""
+        try:
+            score = int(record["Score"])
+        except (TypeError, ValueError):
+            # e.g. the "Not Applicable" or NaN fill of legacy Excel sheets
+            return None
+        return (
+            record["Type"],
+            record["Name"],
+            str(record.get("Class", "N/A")),
+            str(record.get("Section", "N/A")),
+            score,
+        )
+
+    @staticmethod
+    def _record(row: tuple) -> Dict[str, Any]:
+        return dict(zip(COLUMNS, row))
+
+    def upsert_many(self, records: List[Dict[str, Any]]) -> int:
+        """Insert players, or raise an existing player's score if the new one is higher.
+
+        Records without a numeric score are skipped; returns how many were applied.
+        """
+        rows = [row for row in map(self._row, records) if row is not None]
+        if len(rows) < len(records):
+            print(f"Skipped {len(records) - len(rows)} leaderboard records without a numeric score.")
+        with self.connection:
+            self.connection.executemany("""
+                INSERT INTO leaderboard (type, name, class_name, section, score) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (name, class_name, section) DO UPDATE
+                SET type = excluded.type, score = excluded.score
+                WHERE excluded.score > leaderboard.score
+            """, rows)
+        return len(rows)
+
+    def upsert(self, record: Dict[str, Any]) -> None:
+        self.upsert_many([record])
+
+    def top(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Records ordered by descending score; all of them when limit is None."""
+        rows = self.connection.execute("""
+            SELECT type, name, class_name, section, score FROM leaderboard
+            ORDER BY score DESC, rowid LIMIT ?
+        """, (-1 if limit is None else limit,))
+        return [self._record(row) for row in rows]
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM leaderboard").fetchone()[0]
+
+    def import_excel(self, excel_path: str) -> int:
+        """Merge the players of an Excel leaderboard into the store; returns rows imported."""
+        import pandas as pd
+
+        df = pd.read_excel(excel_path, engine="openpyxl", converters={"Class": str, "Section": str})
+        df.fillna("Not Applicable", inplace=True)
+        return self.upsert_many(df.to_dict(orient="records"))
+
+    def export_excel(self, excel_path: str) -> None:
+        """Write the whole leaderboard to an Excel workbook."""
+        import pandas as pd
+
+        df = pd.DataFrame(self.top(), columns=COLUMNS)
+        df.to_excel(excel_path, index=False, engine="openpyxl")
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+def open_leaderboard_store(db_path: str, excel_path: str) -> LeaderboardStore:
+    """Open the store, seeding a new database from the Excel leaderboard if there is one."""
+    store = LeaderboardStore(db_path)
+    if store.count() == 0 and os.path.exists(excel_path):
+        imported = store.import_excel(excel_path)
+        print(f"Imported {imported} leaderboard rows from {excel_path}.")
+    return store
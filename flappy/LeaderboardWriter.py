@@ -0,0 +1,131 @@
+import json
+import os
+import queue
+import threading
+from typing import Dict, Any
+
+from flappy.LeaderboardStore import LeaderboardStore
+
+
+class LeaderboardWriter:
+    """Persists leaderboard scores on a background thread.
+
+    submit() appends the record to a write-ahead journal and returns at once;
+    the worker then upserts queued records into SQLite. The Excel workbook is
+    only an export, so it is rewritten once when the writer closes, to a
+    temporary file that atomically replaces the old one. Upserts only ever keep
+    a player's best score, so replaying the journal after a crash is safe even
+    for records that were already stored.
+    """
+
+    def __init__(self, db_path: str, excel_path: str, journal_path: str):
+        self.db_path = db_path
+        self.excel_path = excel_path
+        self.journal_path = journal_path
+        self._queue: queue.Queue = queue.Queue()
+        self._journal_lock = threading.Lock()
+        self._writer_thread = None
+        self._export_pending = False
+
+    def _read_journal(self) -> list:
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal:
+                lines = journal.readlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                pass  # A torn final line from a crash mid-append
+        return records
+
+    def _truncate_journal(self) -> None:
+        with open(self.journal_path, "w", encoding="utf-8"):
+            pass
+
+    def recover(self, store: LeaderboardStore) -> int:
+        """Apply records journaled before an unclean exit; call before start()."""
+        records = self._read_journal()
+        if records:
+            store.upsert_many(records)
+            print(f"Recovered {len(records)} leaderboard records from the journal.")
+        self._truncate_journal()
+        return len(records)
+
+    def submit(self, record: Dict[str, Any]) -> None:
+        """Durably journal a record and queue it for the background writer."""
+        with self._journal_lock:
+            try:
+                with open(self.journal_path, "a", encoding="utf-8") as journal:
+                    journal.write(json.dumps(record) + "\n")
+                    journal.flush()
+                    os.fsync(journal.fileno())
+            except OSError as e:
+                print(f"Error journaling leaderboard record: {e}")
+            # Queue under the lock so the worker never truncates a journaled record it has not seen
+            self._queue.put(record)
+
+    def _export_excel(self, store: LeaderboardStore) -> None:
+        root, extension = os.path.splitext(self.excel_path)
+        temporary_path = f"{root}.tmp{extension}"
+        store.export_excel(temporary_path)
+        with open(temporary_path, "rb+") as workbook:
+            os.fsync(workbook.fileno())
+        os.replace(temporary_path, self.excel_path)
+
+    def _write_loop(self) -> None:
+        """Private method to drain the queue until the stop sentinel arrives."""
+        store = LeaderboardStore(self.db_path)
+        try:
+            running = True
+            # Records of a failed batch; retried with the next one and kept in the journal until then
+            unapplied = []
+            while running:
+                batch = [self._queue.get()]
+                # Coalesce whatever else is already waiting into one transaction
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    running = False
+                    batch = [record for record in batch if record is not None]
+                batch = unapplied + batch
+                if not batch:
+                    continue
+                try:
+                    store.upsert_many(batch)
+                    unapplied = []
+                    with self._journal_lock:
+                        if self._queue.empty():
+                            self._truncate_journal()
+                    self._export_pending = True
+                    print("Leaderboard updated successfully.")
+                except Exception as e:
+                    unapplied = batch
+                    print(f"Error managing leaderboard, {len(batch)} records left in the journal: {e}")
+            if self._export_pending:
+                # Rewriting the workbook is slow pure-Python work, so it is left for shutdown
+                try:
+                    self._export_excel(store)
+                    self._export_pending = False
+                except Exception as e:
+                    print(f"Error exporting leaderboard: {e}")
+        finally:
+            store.close()
+
+    def start(self) -> None:
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+            self._writer_thread.start()
+
+    def close(self) -> None:
+        """Flush pending records, export the Excel workbook and stop the worker."""
+        if self._writer_thread is not None:
+            self._queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+        self._export_pending = False
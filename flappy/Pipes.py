@@ -2,7 +2,8 @@ import pygame
 from pygame import SurfaceType
 from pygame.rect import RectType
 
-from flappy.constants import SPRITE_PIPES
+from flappy.AssetCache import load_pipe_image, PIPE_REFERENCE_HEIGHT
+from flappy.constants import PIPE_SPAWN_INTERVAL
 from collections import deque
 import random
 
@@ -10,23 +11,42 @@ class Pipes:
     DISTANCE_BETWEEN = 500
     SPACE_BETWEEN = 250
 
-    def __init__(self, window_size:tuple):
-        self.scale = window_size[1] / 1328
-        self.bottom_image: SurfaceType = pygame.transform.scale_by(pygame.image.load(SPRITE_PIPES), self.scale)
-        self.top_image: SurfaceType = pygame.transform.flip(self.bottom_image, True, False)
-        self.rect: RectType = self.bottom_image.get_rect()
-        self.window_size = window_size
+    def __init__(self, window_size:tuple, seed=None):
+        # A seeded generator makes the pipe layout reproducible in simulations
+        self.random = random.Random(seed)
+        self.rescale(window_size)
         self.pipes: deque[tuple] = deque()
+        self.reset()
+
+    def reset(self):
+        """Remove all pipes and restore the starting spawn rate."""
+        self.pipes.clear()
         self.spawn_timer = 0
-        self.spawn_interval = 40
+        self.spawn_interval = PIPE_SPAWN_INTERVAL
+
+    def rescale(self, window_size: tuple):
+        """Build both pipe orientations and their collision masks for a window size.
+
+        Drawing only blits these cached surfaces, so nothing is allocated per frame.
+        """
+        self.window_size = window_size
+        self.scale = window_size[1] / PIPE_REFERENCE_HEIGHT
+        self.bottom_image: SurfaceType = load_pipe_image(window_size)
+        # The top pipe of a pair is drawn as the vertically flipped bottom image
+        self.flipped_image: SurfaceType = pygame.transform.flip(self.bottom_image, False, True)
+        self.rect: RectType = self.bottom_image.get_rect()
+        # Collision masks are built once; the sprites never change after load
+        self.bottom_mask = pygame.mask.from_surface(self.bottom_image)
+        self.top_mask = pygame.mask.from_surface(self.flipped_image)
 
     def pipe_velocity(self):
+        """Pixels moved per simulation step; spawn_interval is counted in steps."""
         return Pipes.DISTANCE_BETWEEN / self.spawn_interval
 
     def add_pipe_pair(self):
         top_pipe = self.rect.copy()
         top_pipe.x = self.window_size[0]
-        top_pipe.y = random.randint(-800, -200) * self.scale
+        top_pipe.y = self.random.randint(-800, -200) * self.scale
 
         bottom_pipe = self.rect.copy()
         bottom_pipe.x = self.window_size[0]
@@ -47,7 +67,9 @@ class Pipes:
             self.add_pipe_pair()
             self.spawn_timer = 0
 
-    def draw(self, screen):
+    def draw(self, screen) -> list:
+        dirty_rects = []
         for top, bottom in self.pipes:
-            screen.blit(pygame.transform.flip(self.bottom_image, False, True), top)
-            screen.blit(self.bottom_image, bottom)
\ No newline at end of file
+            dirty_rects.append(screen.blit(self.flipped_image, top))
+            dirty_rects.append(screen.blit(self.bottom_image, bottom))
+        return dirty_rects
\ No newline at end of file
@@ -0,0 +1,75 @@
+import csv
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+
+def percentile(sorted_samples: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * fraction))]
+
+
+class Profiler:
+    """Collects monotonic durations per named stage of the game loop.
+
+    Samples are kept in seconds; max_samples bounds each stage's history so the
+    profiler can stay on for a whole session. A disabled profiler records nothing.
+    """
+
+    def __init__(self, enabled: bool = True, max_samples: Optional[int] = None):
+        self.enabled = enabled
+        self.samples: defaultdict = defaultdict(lambda: deque(maxlen=max_samples))
+
+    @contextmanager
+    def _timed(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples[name].append(time.perf_counter() - start)
+
+    def stage(self, name: str):
+        """Context manager timing one run of a stage."""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+
+    def record(self, name: str, seconds: float):
+        if self.enabled:
+            self.samples[name].append(seconds)
+
+    def clear(self):
+        self.samples.clear()
+
+    def percentile_ms(self, name: str, fraction: float) -> Optional[float]:
+        """A percentile of the recent samples of one stage, or None if it has none."""
+        stage_samples = self.samples.get(name)
+        if not stage_samples:
+            return None
+        return percentile(sorted(stage_samples), fraction) * 1000
+
+    def write_csv(self, path: str):
+        """Write every retained sample as a (stage, sample, ms) row."""
+        with open(path, "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["stage", "sample", "ms"])
+            for name, stage_samples in self.samples.items():
+                for index, seconds in enumerate(list(stage_samples)):
+                    writer.writerow([name, index, f"{seconds * 1000:.3f}"])
+
+    def summary(self) -> dict:
+        """Count, mean and p50/p95/p99 in milliseconds for every stage."""
+        result = {}
+        for name, stage_samples in self.samples.items():
+            if not stage_samples:
+                continue
+            ordered = sorted(stage_samples)
+            result[name] = {
+                "count": len(ordered),
+                "mean_ms": sum(ordered) / len(ordered) * 1000,
+                "p50_ms": percentile(ordered, 0.50) * 1000,
+                "p95_ms": percentile(ordered, 0.95) * 1000,
+                "p99_ms": percentile(ordered, 0.99) * 1000,
+            }
+        return result
@@ -0,0 +1,148 @@
+from bisect import bisect_left
+from collections import namedtuple
+from typing import Dict, Any, Iterable, List, Optional, Sequence
+
+# Where a player moved on the board; old_rank is None for a new player
+RankChange = namedtuple('RankChange', ['player', 'record', 'old_rank', 'new_rank'])
+
+
+def player_key(record: Dict[str, Any]) -> tuple:
+    """The identity a leaderboard keeps one best score for."""
+    return record["Name"], str(record.get("Class", "N/A")), str(record.get("Section", "N/A"))
+
+
+class RankedLeaderboard:
+    """Each player's best record, kept in descending score order in memory.
+
+    A sorted list of rank keys is searched with bisect and a dict indexes the
+    players, so finding a player's rank or the slot for a new score is
+    O(log n); only the list shift on insert is linear, and that is a memmove.
+    Ties keep the order in which players first appeared.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        self._rank_keys: List[tuple] = []
+        self._entries: Dict[tuple, tuple] = {}
+        self._next_sequence = 0
+        for record in records:
+            self.insert_or_improve(record)
+
+    def insert_or_improve(self, record: Dict[str, Any]) -> Optional[RankChange]:
+        """Add a player or raise their best score; returns None if nothing changed."""
+        player = player_key(record)
+        existing = self._entries.get(player)
+        old_rank = None
+        if existing is None:
+            sequence = self._next_sequence
+            self._next_sequence += 1
+        else:
+            rank_key, existing_record = existing
+            if existing_record["Score"] >= record["Score"]:
+                return None
+            sequence = rank_key[1]
+            old_rank = bisect_left(self._rank_keys, rank_key)
+            del self._rank_keys[old_rank]
+        rank_key = (-record["Score"], sequence, player)
+        new_rank = bisect_left(self._rank_keys, rank_key)
+        self._rank_keys.insert(new_rank, rank_key)
+        self._entries[player] = (rank_key, record)
+        return RankChange(player, record, old_rank, new_rank)
+
+    def remove(self, player: tuple) -> Optional[int]:
+        """Drop a player; returns the rank they had, or None if they were absent."""
+        entry = self._entries.pop(player, None)
+        if entry is None:
+            return None
+        rank = bisect_left(self._rank_keys, entry[0])
+        del self._rank_keys[rank]
+        return rank
+
+    def rank_of(self, player: tuple) -> Optional[int]:
+        """Zero-based rank of a player, or None if they are not on the board."""
+        entry = self._entries.get(player)
+        if entry is None:
+            return None
+        return bisect_left(self._rank_keys, entry[0])
+
+    def page(self, offset: int, limit: int) -> List[Dict[str, Any]]:
+        """Records ranked offset to offset + limit - 1."""
+        return [self._entries[rank_key[2]][1] for rank_key in self._rank_keys[offset:offset + limit]]
+
+    def __getitem__(self, rank: int) -> Dict[str, Any]:
+        return self._entries[self._rank_keys[rank][2]][1]
+
+    def __len__(self) -> int:
+        return len(self._rank_keys)
+
+    def __iter__(self):
+        for rank_key in self._rank_keys:
+            yield self._entries[rank_key[2]][1]
+
+
+ALL_PLAYERS = "All"
+NOT_APPLICABLE = ("", "N/A", "Not Applicable")
+
+
+def group_names(record: Dict[str, Any]) -> List[str]:
+    """The leaderboard views a record belongs to: everyone, its Type and its class and section."""
+    names = [ALL_PLAYERS, record["Type"]]
+    class_name = str(record.get("Class", "N/A"))
+    if class_name not in NOT_APPLICABLE:
+        names.append(f"Class {class_name}")
+        section = str(record.get("Section", "N/A"))
+        if section not in NOT_APPLICABLE:
+            names.append(f"Class {class_name}-{section}")
+    return names
+
+
+class GroupedLeaderboard:
+    """The overall leaderboard plus one RankedLeaderboard per Type, Class and Section.
+
+    Every group index is kept up to date on each new score, so switching views
+    never filters or sorts the whole history.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        self.views: Dict[str, RankedLeaderboard] = {ALL_PLAYERS: RankedLeaderboard()}
+        for record in records:
+            self.insert_or_improve(record)
+
+    @property
+    def overall(self) -> RankedLeaderboard:
+        return self.views[ALL_PLAYERS]
+
+    def insert_or_improve(self, record: Dict[str, Any]) -> Optional[RankChange]:
+        """Record a score in every view it belongs to; returns the overall rank change."""
+        player = player_key(record)
+        previous_rank = self.overall.rank_of(player)
+        previous = None if previous_rank is None else self.overall[previous_rank]
+        change = self.overall.insert_or_improve(record)
+        if change is None:
+            return None
+        new_groups = group_names(record)[1:]
+        if previous is not None:
+            # A player's Type may change with their new best score
+            for name in group_names(previous)[1:]:
+                if name not in new_groups:
+                    self.views[name].remove(player)
+                    if not self.views[name]:
+                        # Leave no empty view for the selector to offer
+                        del self.views[name]
+        for name in new_groups:
+            self.views.setdefault(name, RankedLeaderboard()).insert_or_improve(record)
+        return change
+
+    def names(self, class_order: Sequence[str] = ()) -> List[str]:
+        """View names: everyone first, then types, then classes in class_order."""
+        def sort_key(name: str) -> tuple:
+            if name == ALL_PLAYERS:
+                return 0, 0, name
+            if not name.startswith("Class "):
+                return 1, 0, name
+            class_name = name[len("Class "):].split("-")[0]
+            position = class_order.index(class_name) if class_name in class_order else len(class_order)
+            return 2, position, name
+        return sorted(self.views, key=sort_key)
+
+    def __len__(self) -> int:
+        return len(self.overall)
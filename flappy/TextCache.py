@@ -0,0 +1,31 @@
+from collections import OrderedDict
+
+from pygame import SurfaceType
+
+
+class TextCache:
+    """Least-recently-used cache of rendered text surfaces keyed by (text, color).
+
+    HUD labels such as the score or timer change at most once a second, so most
+    frames reuse a surface instead of calling font.render again.
+    """
+
+    def __init__(self, font, max_entries: int = 32):
+        self.font = font
+        self.max_entries = max_entries
+        self._surfaces: OrderedDict = OrderedDict()
+
+    def render(self, text: str, color: tuple) -> SurfaceType:
+        key = (text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        surface = self.font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
@@ -3,7 +3,7 @@ from tkinter import ttk
 from tkinter import messagebox
 from screeninfo import get_monitors
 from flappy.util import center_window
-from flappy.constants import CONSOLE_BLUE
+from flappy.constants import CONSOLE_BLUE, CLASS_OPTIONS
 
 
 class UserForm:
@@ -101,7 +101,7 @@ class UserForm:
         class_dropdown = ttk.Combobox(
             self.student_frame,
             textvariable=self.class_var,
-            values=["Nursery", "LKG", "UKG", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"],
+            values=CLASS_OPTIONS,
             state="readonly",
             font=self.font,
         )
@@ -0,0 +1,136 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, Any, Sequence
+
+
+class VirtualLeaderboard:
+    """A leaderboard Treeview that only holds the rows currently in view.
+
+    The data source is any ranked collection with __len__ and
+    page(offset, limit). The Treeview keeps a fixed number of row items whose
+    values are rewritten as the view scrolls, and the scrollbar is driven from
+    the source's length, so scrolling and refreshing cost the same for ten
+    records as for a hundred thousand. Because row items are reused, the
+    selection is kept as a rank and reapplied to whichever row shows it.
+    """
+
+    def __init__(self, parent, columns: Sequence[str], data_source, visible_rows: int = 10):
+        self.columns = tuple(columns)
+        self.data_source = data_source
+        self.visible_rows = visible_rows
+        self.offset = 0
+        self.selected_rank = None
+
+        self.treeview = ttk.Treeview(parent, columns=self.columns, show="headings", height=visible_rows)
+        for column in self.columns:
+            self.treeview.heading(column, text=column)
+            self.treeview.column(column)
+        self.scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self._on_scrollbar)
+
+        self.treeview.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # Windows and macOS report wheel deltas, X11 reports button 4/5 presses
+        self.treeview.bind("<MouseWheel>", lambda event: self.scroll(-1 if event.delta > 0 else 1))
+        self.treeview.bind("<Button-4>", lambda event: self.scroll(-1))
+        self.treeview.bind("<Button-5>", lambda event: self.scroll(1))
+        self.treeview.bind("<<TreeviewSelect>>", self._on_select)
+        # Only the rows in view exist, so keyboard navigation is routed through the data source too
+        self.treeview.bind("<Up>", lambda event: self.move_selection(-1))
+        self.treeview.bind("<Down>", lambda event: self.move_selection(1))
+        self.treeview.bind("<Prior>", lambda event: self.move_selection(-self.visible_rows))
+        self.treeview.bind("<Next>", lambda event: self.move_selection(self.visible_rows))
+        self.treeview.bind("<Home>", lambda event: self.select_rank(0))
+        self.treeview.bind("<End>", lambda event: self.select_rank(len(self.data_source) - 1))
+
+    def _row_values(self, entry: Dict[str, Any]) -> tuple:
+        return tuple(entry.get(column, "") for column in self.columns)
+
+    def _selected_row_ids(self, row_ids: Sequence[str]) -> tuple:
+        """Private method to find the row item showing the selected rank, if it is in view."""
+        if self.selected_rank is None:
+            return ()
+        index = self.selected_rank - self.offset
+        return (row_ids[index],) if 0 <= index < len(row_ids) else ()
+
+    def _on_select(self, event) -> None:
+        row_ids = self.treeview.get_children()
+        selection = self.treeview.selection()
+        # Selection events from refresh() itself already match selected_rank
+        if selection != self._selected_row_ids(row_ids):
+            self.selected_rank = self.offset + row_ids.index(selection[0]) if selection else None
+
+    def set_data_source(self, data_source) -> None:
+        """Show another ranked collection from its top, with nothing selected."""
+        self.data_source = data_source
+        self.offset = 0
+        self.selected_rank = None
+        self.refresh()
+
+    def _max_offset(self) -> int:
+        return max(0, len(self.data_source) - self.visible_rows)
+
+    def _on_scrollbar(self, action: str, *args) -> None:
+        if action == "moveto":
+            self.scroll_to(round(float(args[0]) * len(self.data_source)))
+        elif action == "scroll":
+            amount = int(args[0])
+            self.scroll(amount * self.visible_rows if args[1] == "pages" else amount)
+
+    def scroll(self, rows: int) -> str:
+        self.scroll_to(self.offset + rows)
+        return "break"
+
+    def scroll_to(self, offset: int) -> None:
+        offset = max(0, min(offset, self._max_offset()))
+        if offset != self.offset:
+            self.offset = offset
+            self.refresh()
+
+    def select_rank(self, rank: int) -> str:
+        """Select a rank, scrolling just far enough to bring it into view."""
+        total = len(self.data_source)
+        if total:
+            rank = max(0, min(rank, total - 1))
+            self.selected_rank = rank
+            if rank < self.offset:
+                self.offset = rank
+            elif rank >= self.offset + self.visible_rows:
+                self.offset = rank - self.visible_rows + 1
+            self.refresh()
+        return "break"
+
+    def move_selection(self, rows: int) -> str:
+        """Move the selection by rows; with nothing selected, select the top row in view."""
+        if self.selected_rank is None:
+            return self.select_rank(self.offset)
+        return self.select_rank(self.selected_rank + rows)
+
+    def show_rank(self, rank: int) -> None:
+        """Scroll so the given rank is in view and select its row."""
+        if not self.offset <= rank < self.offset + self.visible_rows:
+            self.offset = max(0, min(rank - self.visible_rows // 2, self._max_offset()))
+        self.selected_rank = rank
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Fetch the page in view and rewrite the materialized rows."""
+        self.offset = min(self.offset, self._max_offset())
+        entries = self.data_source.page(self.offset, self.visible_rows)
+        row_ids = list(self.treeview.get_children())
+        # Only the row count changes when the source is shorter than the view
+        while len(row_ids) > len(entries):
+            self.treeview.delete(row_ids.pop())
+        while len(row_ids) < len(entries):
+            row_ids.append(self.treeview.insert("", tk.END))
+        for row_id, entry in zip(row_ids, entries):
+            self.treeview.item(row_id, values=self._row_values(entry))
+        selected_row_ids = self._selected_row_ids(row_ids)
+        if self.treeview.selection() != selected_row_ids:
+            self.treeview.selection_set(selected_row_ids)
+
+        total = len(self.data_source)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
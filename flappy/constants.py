@@ -1,4 +1,5 @@
-from flappy.util import resource_path
+import os
+from flappy.util import resource_path, user_cache_dir, user_data_dir
 # Font settings
 FONT_FAMILY = "Helvetica"
 FONT_SIZE_LARGE = 30
@@ -12,7 +13,11 @@ CONSOLE_BLUE = "#0015ac"
 BACKGROUND_COLOR = "black"
 
 # File paths
-EXCEL_FILE_PATH = resource_path("res/leaderboard.xlsx")
+EXCEL_FILE_PATH = resource_path("res/leaderboard.xlsx")  # Bundled leaderboard that seeds a new database
+# Bundled resources may be read-only or temporary, so the leaderboard lives in the user's data directory
+LEADERBOARD_DB_PATH = os.path.join(user_data_dir("Flappy"), "leaderboard.db")
+LEADERBOARD_JOURNAL_PATH = os.path.join(user_data_dir("Flappy"), "leaderboard.journal")
+LEADERBOARD_EXPORT_PATH = os.path.join(user_data_dir("Flappy"), "leaderboard.xlsx")
 LOGO_IMAGE_PATH = resource_path("images/logo.png")
 SCHOOL_IMAGE_PATH = resource_path("images/NHPS.png")
 FONT_FILE_PATH = resource_path("res/JurassicPark.otf")
@@ -21,9 +26,11 @@ SPRITE_BIRD = resource_path("images/pterodactyl.gif")
 SPRITE_LOGO = resource_path("images/logo.png")
 ICON = resource_path("images/pterodactyl.png")
 GAME_OVER_LOGO_PATH = resource_path("images/GameOver.png")
-FLYING_SOUND = "audio/flying.mp3"
-CRASH_SOUND = "audio/crash.mp3"
-JURASSIC_PARK_THEME = "audio/JurassicParkthemesong.wav"
+# Bundled resources may be read-only or temporary, so baked sprites live in the user's cache
+ASSET_CACHE_DIR = os.path.join(user_cache_dir("Flappy"), "assets")  # Pre-scaled sprites; None always decodes
+FLYING_SOUND = resource_path("audio/flying.mp3")
+CRASH_SOUND = resource_path("audio/crash.mp3")
+JURASSIC_PARK_THEME = resource_path("audio/JurassicParkthemesong.wav")
 FRONT_CPU_BINARYPB = "mediapipe/modules/face_landmark/face_landmark_front_cpu.binarypb"
 
 
@@ -37,6 +44,7 @@ ERROR_CLASS_SECTION_REQUIRED = "Please enter both Class and Section."
 
 # Dropdown Options
 ROLE_OPTIONS = ["Teacher", "Student"]
+CLASS_OPTIONS = ["Nursery", "LKG", "UKG", "1", "2", "3", "4", "5", "6", "7", "8", "9", "10"]
 
 
 # Game Configuration
@@ -44,16 +52,39 @@ PIPE_DISTANCE_BETWEEN = 500
 PIPE_SPACE_BETWEEN = 500
 PIPE_SPAWN_INTERVAL = 40
 STAGE_INTERVAL = 10  # Time in seconds before stage increases
+SIMULATION_STEP = 1 / 60  # Simulated seconds advanced by one Pipes.update
+MAX_SIMULATION_STEPS = 5  # Steps run per rendered frame before the simulation falls behind
+
+HEADLESS_WINDOW_SIZE = (1280, 720)  # Window size when running without a display or camera
+
+GAME_SESSION_MODE = True  # Keep the engine, face tracker and camera warm between games
+PREWARM_AT_IDLE_MS = None  # Session mode: warm the tracker this long after the menu opens; None waits for START
+
+# Rendering Configuration
+RENDER_MODE = "full"  # "full" flips the whole window, "dirty" updates only changed rectangles
+CAMERA_REFRESH_INTERVAL = 4  # Dirty mode: frames between camera background refreshes, 0 keeps it static
+CAMERA_BACKGROUND_DIM = 0  # Dirty mode: amount (0-255) subtracted from the camera background
+
+# Performance Monitoring
+PERFORMANCE_OVERLAY = False  # Show FPS and latency overlay at start; F3 toggles it in game
+PROFILER_SAMPLES = 300  # Recent samples kept per profiled stage
+PROFILE_CSV_PATH = None  # Path to dump profiler samples to on exit, or None
 
 
 # Bird Configuration
 BIRD_WIDTH = 50
 BIRD_HEIGHT = 37
+BIRD_FRAME_DURATION = 1 / 60  # Seconds each animation frame is shown
 
 
 # Face Tracking Configuration
 MIN_DETECTION_CONFIDENCE = 0.5
 MIN_TRACKING_CONFIDENCE = 0.5
+TRACKING_PROFILE = "fast"  # "fast" skips iris/lip refinement, "accurate" enables it
+NOSE_LANDMARK_INDEX = 94  # Face mesh landmark whose height steers the bird
+INFERENCE_WIDTH = 640  # Frames are downscaled to this width for inference; None keeps full size
+FACE_INFERENCE_BACKEND = "inline"  # "inline" or "process" (FaceMesh in a worker process)
+ASYNC_FACE_TRACKING = True  # Capture and track faces on a worker thread instead of the render loop
 
 # Colors
  # Black
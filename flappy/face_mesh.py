@@ -56,6 +56,14 @@ FACEMESH_NUM_LANDMARKS = 468
 FACEMESH_NUM_LANDMARKS_WITH_IRISES = 478
 _BINARYPB_FILE_PATH = 'mediapipe/modules/face_landmark/face_landmark_front_cpu.binarypb'
 
+# Named FaceMesh option sets. 'fast' skips the attention model, which only
+# refines the eye and lip contours and adds the iris landmarks; use it when
+# just the overall head position is needed. 'accurate' enables it.
+TRACKING_PROFILES = {
+    'fast': {'refine_landmarks': False},
+    'accurate': {'refine_landmarks': True},
+}
+
 
 class FaceMesh(SolutionBase):
   """MediaPipe Face Mesh.
@@ -108,6 +116,21 @@ class FaceMesh(SolutionBase):
         },
         outputs=['multi_face_landmarks'])
 
+  @classmethod
+  def from_profile(cls, profile: str, **kwargs) -> 'FaceMesh':
+    """Creates a FaceMesh configured by one of the TRACKING_PROFILES.
+
+    Args:
+      profile: A key of TRACKING_PROFILES, e.g. 'fast' or 'accurate'.
+      **kwargs: Other FaceMesh arguments; they override the profile options.
+
+    Raises:
+      ValueError: If the profile is unknown.
+    """
+    if profile not in TRACKING_PROFILES:
+      raise ValueError(f'Unknown tracking profile: {profile!r}')
+    return cls(**{**TRACKING_PROFILES[profile], **kwargs})
+
   def process(self, image: np.ndarray) -> NamedTuple:
     """Processes an RGB image and returns the face landmarks on each detected face.
 
@@ -1,6 +1,5 @@
 import sys
 import os
-import cv2 as cv
 # Use this to resolve the path for bundled resources
 def resource_path(relative_path):
     """Get the absolute path to the resource."""
@@ -10,12 +9,41 @@ def resource_path(relative_path):
     except AttributeError:
         if os.path.exists(relative_path):
             return relative_path
-        # Fallback for running without PyInstaller
-        base_path = os.path.abspath(".")
+        if getattr(sys, "frozen", False):
+            # cx_Freeze installs the resources next to the executable
+            base_path = os.path.dirname(sys.executable)
+        else:
+            # Running from source, resources live inside the flappy package
+            base_path = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base_path, relative_path)
 
 
+def user_cache_dir(app_name):
+    """Per-user directory for caches that should outlive a run, e.g. ~/.cache/<app_name>."""
+    if sys.platform == "win32":
+        base_path = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base_path = os.path.expanduser("~/Library/Caches")
+    else:
+        base_path = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base_path, app_name)
+
+
+def user_data_dir(app_name):
+    """Per-user directory for data that must survive reinstalls, e.g. ~/.local/share/<app_name>."""
+    if sys.platform == "win32":
+        base_path = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base_path = os.path.expanduser("~/Library/Application Support")
+    else:
+        base_path = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base_path, app_name)
+
+
 def find_highest_resolution_camera(window_size):
+    # OpenCV is heavy to import and only needed here, not by every user of this module
+    import cv2 as cv
+
     # Try opening cameras 0 to 9 (you can increase the range if you have more cameras)
     for camera_index in range(10):  # Adjust the range based on your system
         cap = cv.VideoCapture(camera_index)
@@ -0,0 +1,11 @@
+import pytest
+
+
+def _make_record(name, score, type_="Student", class_name="5", section="A"):
+    return {"Type": type_, "Name": name, "Class": class_name, "Section": section, "Score": score}
+
+
+@pytest.fixture
+def make_record():
+    """Factory for leaderboard records; a student in class 5-A unless told otherwise."""
+    return _make_record
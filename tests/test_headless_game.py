@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+pytest.importorskip("pygame")
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+pytest.importorskip("PIL")
+
+import flappy.AssetCache as asset_cache  # noqa: E402
+from flappy.GameEngine import GameEngine  # noqa: E402
+from flappy.InputSource import SyntheticFaceSource, sine_trajectory  # noqa: E402
+from flappy.constants import HEADLESS_WINDOW_SIZE  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def temporary_asset_cache(tmp_path, monkeypatch):
+    """Bake sprites into tmp_path instead of the developer's cache directory."""
+    monkeypatch.setattr(asset_cache, "_default_cache", asset_cache.AssetCache(str(tmp_path / "assets")))
+
+
+def _play(seed):
+    """Play one headless game; returns the score, frames played and each spawned pipe's y."""
+    face_source = SyntheticFaceSource(sine_trajectory())
+    game = GameEngine(headless=True, face_tracker=face_source, window_size=HEADLESS_WINDOW_SIZE, seed=seed)
+    spawned_y = []
+    add_pipe_pair = game.pipes.add_pipe_pair
+
+    def recording_add_pipe_pair():
+        add_pipe_pair()
+        spawned_y.append(game.pipes.pipes[-1][0].y)
+
+    game.pipes.add_pipe_pair = recording_add_pipe_pair
+    try:
+        score = game.run()
+    finally:
+        game.cleanup()
+    return score, face_source.frame_index, spawned_y
+
+
+def test_seeded_headless_games_are_identical():
+    first = _play(3)
+    assert len(first[2]) > 1
+    assert _play(3) == first
+
+
+def test_seed_changes_pipe_layout():
+    assert _play(3)[2][:2] != _play(4)[2][:2]
+
+
+def test_headless_engine_restores_sdl_drivers(monkeypatch):
+    monkeypatch.delenv("SDL_VIDEODRIVER", raising=False)
+    monkeypatch.setenv("SDL_AUDIODRIVER", "pulseaudio")
+    _play(0)
+    assert "SDL_VIDEODRIVER" not in os.environ
+    assert os.environ["SDL_AUDIODRIVER"] == "pulseaudio"
@@ -0,0 +1,25 @@
+import math
+
+from flappy.LeaderboardStore import LeaderboardStore
+
+
+def test_upsert_keeps_best_score(tmp_path, make_record):
+    store = LeaderboardStore(str(tmp_path / "leaderboard.db"))
+    try:
+        store.upsert_many([make_record("a", 4), make_record("b", 6)])
+        store.upsert(make_record("a", 9))
+        store.upsert(make_record("b", 2))
+        assert [(record["Name"], record["Score"]) for record in store.top()] == [("a", 9), ("b", 6)]
+    finally:
+        store.close()
+
+
+def test_rows_without_numeric_score_are_skipped(tmp_path, make_record):
+    store = LeaderboardStore(str(tmp_path / "leaderboard.db"))
+    try:
+        records = [make_record("a", "Not Applicable"), make_record("b", math.nan), make_record("c", None),
+                   make_record("d", 7.0), make_record("e", "3")]
+        assert store.upsert_many(records) == 2
+        assert [(record["Name"], record["Score"]) for record in store.top()] == [("d", 7), ("e", 3)]
+    finally:
+        store.close()
@@ -0,0 +1,100 @@
+import sqlite3
+import threading
+
+from flappy.LeaderboardStore import LeaderboardStore
+from flappy.LeaderboardWriter import LeaderboardWriter
+
+
+def test_journal_is_not_truncated_before_a_record_is_queued(tmp_path, monkeypatch, make_record):
+    """A record journaled while the worker finishes a batch must survive the worker's truncation."""
+    db_path = str(tmp_path / "leaderboard.db")
+    writer = LeaderboardWriter(db_path, str(tmp_path / "leaderboard.xlsx"), str(tmp_path / "journal"))
+    upserting = threading.Event()
+    release_upsert = threading.Event()
+    truncated = threading.Event()
+    original_upsert_many = LeaderboardStore.upsert_many
+    original_truncate = writer._truncate_journal
+
+    def slow_upsert_many(store, records):
+        upserting.set()
+        release_upsert.wait(5)
+        original_upsert_many(store, records)
+
+    def recording_truncate():
+        original_truncate()
+        truncated.set()
+
+    journal_at_put = []
+    original_put = writer._queue.put
+
+    def delayed_put(record):
+        if record is not None and record["Name"] == "second":
+            # Let the worker finish "first" and try to truncate before "second" is queued
+            release_upsert.set()
+            truncated.wait(1)
+            with open(writer.journal_path, encoding="utf-8") as journal:
+                journal_at_put.append(journal.read())
+        original_put(record)
+
+    monkeypatch.setattr(LeaderboardStore, "upsert_many", slow_upsert_many)
+    monkeypatch.setattr(writer, "_truncate_journal", recording_truncate)
+    monkeypatch.setattr(writer._queue, "put", delayed_put)
+
+    writer.start()
+    writer.submit(make_record("first", 3))
+    assert upserting.wait(5)
+    writer.submit(make_record("second", 7))
+    writer.close()
+
+    assert '"second"' in journal_at_put[0]
+    store = LeaderboardStore(db_path)
+    try:
+        assert [record["Name"] for record in store.top()] == ["second", "first"]
+    finally:
+        store.close()
+
+
+def test_failed_batch_is_retried_and_not_truncated(tmp_path, monkeypatch, make_record):
+    """A batch whose upsert fails must not be dropped by the next batch's journal truncation."""
+    db_path = str(tmp_path / "leaderboard.db")
+    writer = LeaderboardWriter(db_path, str(tmp_path / "leaderboard.xlsx"), str(tmp_path / "journal"))
+    failed = threading.Event()
+    original_upsert_many = LeaderboardStore.upsert_many
+
+    def locked_once_upsert_many(store, records):
+        if not failed.is_set():
+            failed.set()
+            raise sqlite3.OperationalError("database is locked")
+        return original_upsert_many(store, records)
+
+    monkeypatch.setattr(LeaderboardStore, "upsert_many", locked_once_upsert_many)
+    writer.start()
+    writer.submit(make_record("first", 3))
+    assert failed.wait(5)
+    with open(writer.journal_path, encoding="utf-8") as journal:
+        assert '"first"' in journal.read()
+    writer.submit(make_record("second", 7))
+    writer.close()
+
+    store = LeaderboardStore(db_path)
+    try:
+        assert [record["Name"] for record in store.top()] == ["second", "first"]
+    finally:
+        store.close()
+
+
+def test_recover_replays_journaled_records(tmp_path):
+    db_path = str(tmp_path / "leaderboard.db")
+    journal_path = str(tmp_path / "journal")
+    with open(journal_path, "w", encoding="utf-8") as journal:
+        journal.write('{"Type": "Teacher", "Name": "a", "Class": "N/A", "Section": "N/A", "Score": 4}\n')
+        journal.write('{"Type": "Tea')  # Torn final line
+    writer = LeaderboardWriter(db_path, str(tmp_path / "leaderboard.xlsx"), journal_path)
+    store = LeaderboardStore(db_path)
+    try:
+        assert writer.recover(store) == 1
+        assert store.top()[0]["Score"] == 4
+    finally:
+        store.close()
+    with open(journal_path, encoding="utf-8") as journal:
+        assert journal.read() == ""
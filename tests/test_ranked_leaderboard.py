@@ -0,0 +1,107 @@
+import random
+
+from flappy.RankedLeaderboard import (
+    ALL_PLAYERS,
+    GroupedLeaderboard,
+    RankChange,
+    RankedLeaderboard,
+    group_names,
+    player_key,
+)
+
+
+def _names(board):
+    return [record["Name"] for record in board]
+
+
+def test_insert_orders_by_descending_score(make_record):
+    board = RankedLeaderboard([make_record("a", 3), make_record("b", 9), make_record("c", 5)])
+    assert _names(board) == ["b", "c", "a"]
+    assert len(board) == 3
+    assert board[0]["Score"] == 9
+    assert _names(board.page(1, 5)) == ["c", "a"]
+
+
+def test_ties_keep_first_appearance_order(make_record):
+    board = RankedLeaderboard([make_record("a", 5), make_record("b", 5), make_record("c", 5)])
+    assert _names(board) == ["a", "b", "c"]
+    # Improving to a tied score does not jump ahead of players who got there first
+    board.insert_or_improve(make_record("d", 1))
+    board.insert_or_improve(make_record("d", 5))
+    assert _names(board) == ["a", "b", "c", "d"]
+
+
+def test_insert_or_improve_reports_rank_change(make_record):
+    board = RankedLeaderboard([make_record("a", 10), make_record("b", 5)])
+    change = board.insert_or_improve(make_record("c", 7))
+    assert change == RankChange(player_key(make_record("c", 7)), make_record("c", 7), None, 1)
+    change = board.insert_or_improve(make_record("b", 20))
+    assert (change.old_rank, change.new_rank) == (2, 0)
+    assert _names(board) == ["b", "a", "c"]
+
+
+def test_lower_or_equal_score_changes_nothing(make_record):
+    board = RankedLeaderboard([make_record("a", 10)])
+    assert board.insert_or_improve(make_record("a", 10)) is None
+    assert board.insert_or_improve(make_record("a", 4)) is None
+    assert board[0]["Score"] == 10
+
+
+def test_rank_of_and_remove(make_record):
+    board = RankedLeaderboard([make_record("a", 10), make_record("b", 5)])
+    player = player_key(make_record("b", 0))
+    assert board.rank_of(player) == 1
+    assert board.rank_of(("missing", "5", "A")) is None
+    assert board.remove(player) == 1
+    assert board.remove(player) is None
+    assert _names(board) == ["a"]
+
+
+def test_matches_brute_force_ranking(make_record):
+    generator = random.Random(7)
+    board = RankedLeaderboard()
+    best = {}
+    first_seen = {}
+    for index in range(500):
+        record = make_record(f"p{generator.randrange(60)}", generator.randrange(40))
+        board.insert_or_improve(record)
+        first_seen.setdefault(record["Name"], index)
+        if record["Name"] not in best or record["Score"] > best[record["Name"]]:
+            best[record["Name"]] = record["Score"]
+    expected = sorted(best, key=lambda name: (-best[name], first_seen[name]))
+    assert _names(board) == expected
+    for rank, name in enumerate(expected):
+        assert board.rank_of((name, "5", "A")) == rank
+
+
+def test_group_names(make_record):
+    assert group_names(make_record("a", 1, class_name="5", section="B")) == [
+        ALL_PLAYERS, "Student", "Class 5", "Class 5-B"]
+    assert group_names(make_record("a", 1, "Teacher", "Not Applicable", "Not Applicable")) == [
+        ALL_PLAYERS, "Teacher"]
+
+
+def test_grouped_views_hold_only_their_players(make_record):
+    grouped = GroupedLeaderboard([
+        make_record("a", 5, class_name="5", section="A"),
+        make_record("b", 8, class_name="5", section="B"),
+        make_record("c", 3, class_name="7", section="A"),
+        make_record("t", 9, "Teacher", "Not Applicable", "Not Applicable"),
+    ])
+    assert _names(grouped.overall) == ["t", "b", "a", "c"]
+    assert _names(grouped.views["Student"]) == ["b", "a", "c"]
+    assert _names(grouped.views["Class 5"]) == ["b", "a"]
+    assert _names(grouped.views["Class 5-A"]) == ["a"]
+    assert _names(grouped.views["Teacher"]) == ["t"]
+    assert grouped.names(["5", "7"]) == [
+        ALL_PLAYERS, "Student", "Teacher", "Class 5", "Class 5-A", "Class 5-B", "Class 7", "Class 7-A"]
+
+
+def test_type_change_moves_player_and_drops_empty_view(make_record):
+    grouped = GroupedLeaderboard([make_record("a", 5, "Teacher"), make_record("b", 4)])
+    change = grouped.insert_or_improve(make_record("a", 9, "Student"))
+    assert (change.old_rank, change.new_rank) == (0, 0)
+    assert _names(grouped.views["Student"]) == ["a", "b"]
+    assert "Teacher" not in grouped.views
+    assert "Teacher" not in grouped.names()
+    assert grouped.insert_or_improve(make_record("a", 2, "Teacher")) is None